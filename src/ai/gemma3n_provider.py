@@ -4,6 +4,7 @@ This module provides AI model integration for the default mode network simulatio
 """
 
 import asyncio
+import functools
 import hashlib
 import json
 import logging
@@ -153,8 +154,13 @@ class Gemma3NProvider:
                 "content": request.prompt
             })
             
-            # Call Ollama
-            response = self.client.chat(
+            # Call Ollama. The client blocks, so run it in the default
+            # executor: the event loop stays free and concurrent requests
+            # (e.g. every agent reasoning in the same round) reach the server
+            # together, where it batches up to OLLAMA_NUM_PARALLEL of them
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(None, functools.partial(
+                self.client.chat,
                 model=self.model_name,
                 messages=messages,
                 options={
@@ -162,7 +168,7 @@ class Gemma3NProvider:
                     "top_p": request.top_p,
                     "num_predict": request.max_tokens
                 }
-            )
+            ))
             
             # Calculate response time
             response_time = (datetime.now() - start_time).total_seconds()
@@ -5,7 +5,7 @@ This module provides task scheduling and resource management capabilities.
 
 from .task_scheduler import TaskScheduler
 from .task import Task, TaskPriority, TaskState
-from .scheduling_algorithm import SchedulingAlgorithm, RoundRobinAlgorithm, PriorityAlgorithm, DeadlineAlgorithm, HybridAlgorithm
+from .scheduling_algorithm import SchedulingAlgorithm, RoundRobinAlgorithm, PriorityAlgorithm, DeadlineAlgorithm, HybridAlgorithm, SyncScheduler
 from .resource_manager import ResourceManager, Resource, ResourceType
 
 __all__ = [
@@ -18,6 +18,7 @@ __all__ = [
     'PriorityAlgorithm',
     'DeadlineAlgorithm',
     'HybridAlgorithm',
+    'SyncScheduler',
     'ResourceManager',
     'Resource',
     'ResourceType'
@@ -3,15 +3,70 @@ Resource Manager module for Daydreamer Project
 This module provides resource allocation and management capabilities.
 """
 
-from dataclasses import dataclass, field
+from array import array
+from collections import defaultdict
+from contextlib import ExitStack
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from enum import Enum
-from typing import Dict, List, Optional, Set, Any
+from enum import Enum, IntEnum
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Any
 import logging
+import sys
 import threading
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Finer than DEBUG: full per-allocation payloads are only logged at this level
+TRACE = logging.DEBUG - 1
+
+# Below this many resources a plain loop beats the NumPy call overhead
+VECTORIZE_THRESHOLD = 64
+
+# Most _Allocation records kept around for reuse after deallocation
+FREE_LIST_LIMIT = 1024
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _fit_batch(offsets, indices, amounts, available, accepted):
+    """
+    Greedily admit a batch of allocation requests in order.
+    
+    Request r needs amounts[k] of resource indices[k] for k in
+    offsets[r]:offsets[r + 1]. A request is admitted only if all of its
+    amounts fit; admitted amounts are subtracted from ``available`` so later
+    requests see them. Sets accepted[r] for every admitted request.
+    """
+    for r in range(len(offsets) - 1):
+        start = offsets[r]
+        end = offsets[r + 1]
+        fits = True
+        for k in range(start, end):
+            if available[indices[k]] < amounts[k]:
+                fits = False
+                break
+        if fits:
+            for k in range(start, end):
+                available[indices[k]] -= amounts[k]
+            accepted[r] = True
+
+
+if NUMBA_AVAILABLE:
+    _fit_batch = njit(cache=True)(_fit_batch)
+
 
 class ResourceType(Enum):
     """Types of resources that can be managed"""
@@ -21,9 +76,14 @@ class ResourceType(Enum):
     STORAGE = "storage"
     GPU = "gpu"
     CUSTOM = "custom"
+    
+    def __init__(self, value):
+        # Dense per-member int; hashing/comparing it is far cheaper than going
+        # through Enum.__hash__/__eq__, so internal indexes key on it
+        self.code = len(type(self).__members__)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Resource:
     """
     Represents a resource that can be allocated to tasks.
@@ -54,12 +114,44 @@ class Resource:
     created_at: datetime = field(default_factory=datetime.now)
     last_updated: datetime = field(default_factory=datetime.now)
     
+    # Cached resource_type.code for the type indexes
+    _type_code: int = field(init=False, repr=False, compare=False)
+    # Cached serialization pieces for to_dict; timestamps are keyed on the
+    # identity of the datetime they were rendered from
+    _type_str: str = field(init=False, repr=False, compare=False)
+    _created_iso: Optional[Tuple[datetime, str]] = field(default=None, init=False,
+                                                         repr=False, compare=False)
+    _updated_iso: Optional[Tuple[datetime, str]] = field(default=None, init=False,
+                                                         repr=False, compare=False)
+    # Held by ResourceManager (and pools) around allocate/deallocate, taken in
+    # resource_id order; the Resource methods themselves do not lock
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False,
+                                  repr=False, compare=False)
+    # Called as listener(resource, amount) after every allocate (+amount) or
+    # deallocate (-amount); used by pools to keep running totals
+    _listeners: List[Callable[['Resource', float], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize the resource after creation"""
         self.available = self.capacity
+        self._type_code = self.resource_type.code
+        self._type_str = self.resource_type.value
         if self.capacity <= 0:
             raise ValueError("Resource capacity must be positive")
     
+    def __getstate__(self):
+        """Copy/pickle state without the lock and the owners' listeners"""
+        return {f.name: getattr(self, f.name) for f in fields(self)
+                if f.name not in ('_lock', '_listeners')}
+    
+    def __setstate__(self, state):
+        """Restore copied state with a fresh lock and no listeners"""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self._lock = threading.Lock()
+        self._listeners = []
+    
     def is_available(self, amount: float = 1.0) -> bool:
         """
         Check if the specified amount is available.
@@ -83,16 +175,21 @@ class Resource:
         Returns:
             True if allocation was successful
         """
-        if not self.is_available(amount):
+        available = self.available
+        if available < amount:
             logger.warning(f"Cannot allocate {amount} {self.unit} of {self.name} "
-                          f"(available: {self.available})")
+                          f"(available: {available})")
             return False
         
-        self.available -= amount
+        self.available = available - amount
         self.allocated += amount
         self.last_updated = datetime.now()
+        for listener in self._listeners:
+            listener(self, amount)
         
-        logger.debug(f"Allocated {amount} {self.unit} of {self.name} to task {task_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Allocated %s %s of %s to task %s",
+                         amount, self.unit, self.name, task_id)
         return True
     
     def deallocate(self, amount: float, task_id: str) -> bool:
@@ -106,16 +203,21 @@ class Resource:
         Returns:
             True if deallocation was successful
         """
-        if amount > self.allocated:
+        allocated = self.allocated
+        if allocated < amount:
             logger.warning(f"Cannot deallocate {amount} {self.unit} of {self.name} "
-                          f"(allocated: {self.allocated})")
+                          f"(allocated: {allocated})")
             return False
         
+        self.allocated = allocated - amount
         self.available += amount
-        self.allocated -= amount
         self.last_updated = datetime.now()
+        for listener in self._listeners:
+            listener(self, -amount)
         
-        logger.debug(f"Deallocated {amount} {self.unit} of {self.name} from task {task_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Deallocated %s %s of %s from task %s",
+                         amount, self.unit, self.name, task_id)
         return True
     
     def get_utilization(self) -> float:
@@ -125,8 +227,7 @@ class Resource:
         Returns:
             Utilization percentage (0.0 to 1.0)
         """
-        if self.capacity == 0:
-            return 0.0
+        # capacity is validated positive in __post_init__
         return self.allocated / self.capacity
     
     def get_availability_percentage(self) -> float:
@@ -136,8 +237,7 @@ class Resource:
         Returns:
             Availability percentage (0.0 to 1.0)
         """
-        if self.capacity == 0:
-            return 0.0
+        # capacity is validated positive in __post_init__
         return self.available / self.capacity
     
     def to_dict(self) -> Dict[str, Any]:
@@ -147,17 +247,25 @@ class Resource:
         Returns:
             Dictionary representation of the resource
         """
+        created_iso = self._created_iso
+        if created_iso is None or created_iso[0] is not self.created_at:
+            created_iso = self._created_iso = (self.created_at, self.created_at.isoformat())
+        
+        updated_iso = self._updated_iso
+        if updated_iso is None or updated_iso[0] is not self.last_updated:
+            updated_iso = self._updated_iso = (self.last_updated, self.last_updated.isoformat())
+        
         return {
             'resource_id': self.resource_id,
             'name': self.name,
-            'resource_type': self.resource_type.value,
+            'resource_type': self._type_str,
             'capacity': self.capacity,
             'available': self.available,
             'allocated': self.allocated,
             'unit': self.unit,
             'metadata': self.metadata,
-            'created_at': self.created_at.isoformat(),
-            'last_updated': self.last_updated.isoformat(),
+            'created_at': created_iso[1],
+            'last_updated': updated_iso[1],
             'utilization': self.get_utilization(),
             'availability_percentage': self.get_availability_percentage()
         }
@@ -179,6 +287,13 @@ class ResourcePool:
         self.name = name
         self.description = description
         self.resources: Dict[str, Resource] = {}
+        # Indexes below are keyed by ResourceType.code
+        self._by_type: Dict[int, Dict[str, Resource]] = defaultdict(dict)
+        
+        # Running per-type totals, kept in sync via resource listeners
+        self._capacity_by_type: Dict[int, float] = defaultdict(float)
+        self._available_by_type: Dict[int, float] = defaultdict(float)
+        self._totals_lock = threading.Lock()
         self.created_at = datetime.now()
     
     def add_resource(self, resource: Resource) -> bool:
@@ -195,7 +310,14 @@ class ResourcePool:
             logger.warning(f"Resource {resource.resource_id} already exists in pool {self.name}")
             return False
         
-        self.resources[resource.resource_id] = resource
+        with resource._lock:
+            self.resources[resource.resource_id] = resource
+            self._by_type[resource._type_code][resource.resource_id] = resource
+            with self._totals_lock:
+                self._capacity_by_type[resource._type_code] += resource.capacity
+                self._available_by_type[resource._type_code] += resource.available
+            resource._listeners.append(self._on_resource_change)
+        
         logger.debug(f"Added resource {resource.name} to pool {self.name}")
         return True
     
@@ -214,14 +336,26 @@ class ResourcePool:
             return False
         
         resource = self.resources[resource_id]
-        if resource.allocated > 0:
-            logger.warning(f"Cannot remove resource {resource_id} with active allocations")
-            return False
+        with resource._lock:
+            if resource.allocated > 0:
+                logger.warning(f"Cannot remove resource {resource_id} with active allocations")
+                return False
+            
+            resource._listeners.remove(self._on_resource_change)
+            with self._totals_lock:
+                self._capacity_by_type[resource._type_code] -= resource.capacity
+                self._available_by_type[resource._type_code] -= resource.available
+            del self.resources[resource_id]
+            del self._by_type[resource._type_code][resource_id]
         
-        del self.resources[resource_id]
         logger.debug(f"Removed resource {resource_id} from pool {self.name}")
         return True
     
+    def _on_resource_change(self, resource: Resource, amount: float):
+        """Apply an allocation delta from a member resource to the running totals"""
+        with self._totals_lock:
+            self._available_by_type[resource._type_code] -= amount
+    
     def get_resources_by_type(self, resource_type: ResourceType) -> List[Resource]:
         """
         Get all resources of a specific type.
@@ -232,7 +366,7 @@ class ResourcePool:
         Returns:
             List of resources of the specified type
         """
-        return [r for r in self.resources.values() if r.resource_type == resource_type]
+        return list(self._by_type.get(resource_type.code, {}).values())
     
     def get_total_capacity(self, resource_type: ResourceType) -> float:
         """
@@ -244,7 +378,7 @@ class ResourcePool:
         Returns:
             Total capacity
         """
-        return sum(r.capacity for r in self.get_resources_by_type(resource_type))
+        return self._capacity_by_type.get(resource_type.code, 0.0)
     
     def get_total_available(self, resource_type: ResourceType) -> float:
         """
@@ -256,7 +390,37 @@ class ResourcePool:
         Returns:
             Total available capacity
         """
-        return sum(r.available for r in self.get_resources_by_type(resource_type))
+        return self._available_by_type.get(resource_type.code, 0.0)
+
+
+class Stat(IntEnum):
+    """Indexes into ResourceManager's counter array"""
+    ALLOC = 0
+    DEALLOC = 1
+    ALLOC_FAIL = 2
+    DEALLOC_FAIL = 3
+    CONFLICTS = 4
+
+
+# Names reported by ResourceManager.get_stats, in Stat order
+_STAT_NAMES = (
+    "total_allocations",
+    "total_deallocations",
+    "allocation_failures",
+    "deallocation_failures",
+    "conflicts_resolved"
+)
+
+
+class _Allocation:
+    """Ledger entry for one task: the rows it owns. Recycled via a free list."""
+    
+    __slots__ = ('task_id', 'rows', 'next_free')
+    
+    def __init__(self):
+        self.task_id: Optional[str] = None
+        self.rows: Optional[List[int]] = None
+        self.next_free: Optional['_Allocation'] = None
 
 
 class ResourceManager:
@@ -274,18 +438,40 @@ class ResourceManager:
     def __init__(self):
         """Initialize the resource manager"""
         self.resources: Dict[str, Resource] = {}
+        self._by_type: Dict[int, Dict[str, Resource]] = defaultdict(dict)  # keyed by ResourceType.code
         self.pools: Dict[str, ResourcePool] = {}
-        self.allocations: Dict[str, Dict[str, float]] = {}  # task_id -> {resource_id: amount}
-        self.lock = threading.RLock()
+        
+        # Allocation ledger, stored column-wise: row i records that task
+        # _alloc_task[i] holds _alloc_amt[i] of resource _alloc_rid[i].
+        # _alloc_index maps each task to the _Allocation record of its rows;
+        # released records go on a free list for the next allocation.
+        self._alloc_task: List[str] = []
+        self._alloc_rid: List[str] = []
+        self._alloc_amt = array('d')
+        self._alloc_index: Dict[str, _Allocation] = {}
+        self._free_head: Optional[_Allocation] = None
+        self._free_count = 0
+        
+        # Per-resource capacity/allocated columns for vectorized queries,
+        # kept in sync by a resource listener and guarded by _arr_lock
+        self._rid_to_idx: Dict[str, int] = {}
+        self._idx_to_rid: List[str] = []
+        self._cap_arr = array('d')
+        self._alloc_arr = array('d')
+        self._arr_lock = threading.Lock()
+        
+        # Guards the resource/pool/allocation tables and stats only; amounts are
+        # guarded by each Resource's own lock, which is always acquired first.
+        # Non-reentrant: public methods never call each other while holding it,
+        # and read-only queries only hold it long enough to snapshot.
+        self.lock = threading.Lock()
         
         # Statistics
-        self.stats = {
-            "total_allocations": 0,
-            "total_deallocations": 0,
-            "allocation_failures": 0,
-            "deallocation_failures": 0,
-            "conflicts_resolved": 0
-        }
+        self._stats = array('q', [0] * len(Stat))  # indexed by Stat
+        
+        # Called with no arguments by note_conflict, so resolvers can sleep
+        # until there is something to resolve instead of polling
+        self._conflict_listeners: List[Callable[[], None]] = []
         
         logger.info("Resource Manager initialized")
     
@@ -299,12 +485,19 @@ class ResourceManager:
         Returns:
             True if added successfully
         """
-        with self.lock:
+        with resource._lock, self.lock:
             if resource.resource_id in self.resources:
                 logger.warning(f"Resource {resource.resource_id} already exists")
                 return False
             
             self.resources[resource.resource_id] = resource
+            self._by_type[resource._type_code][resource.resource_id] = resource
+            with self._arr_lock:
+                self._rid_to_idx[resource.resource_id] = len(self._idx_to_rid)
+                self._idx_to_rid.append(resource.resource_id)
+                self._cap_arr.append(resource.capacity)
+                self._alloc_arr.append(resource.allocated)
+            resource._listeners.append(self._on_resource_change)
             logger.info(f"Added resource: {resource.name} ({resource.resource_type.value})")
             return True
     
@@ -318,20 +511,43 @@ class ResourceManager:
         Returns:
             True if removed successfully
         """
-        with self.lock:
-            if resource_id not in self.resources:
+        resource = self.resources.get(resource_id)
+        if resource is None:
+            logger.warning(f"Resource {resource_id} not found")
+            return False
+        
+        # Resource locks are always taken before the manager lock
+        with resource._lock, self.lock:
+            if self.resources.get(resource_id) is not resource:
                 logger.warning(f"Resource {resource_id} not found")
                 return False
             
-            resource = self.resources[resource_id]
             if resource.allocated > 0:
                 logger.warning(f"Cannot remove resource {resource_id} with active allocations")
                 return False
             
             del self.resources[resource_id]
+            del self._by_type[resource._type_code][resource_id]
+            resource._listeners.remove(self._on_resource_change)
+            with self._arr_lock:
+                # Swap the last column entry into the freed slot
+                idx = self._rid_to_idx.pop(resource_id)
+                last_rid = self._idx_to_rid.pop()
+                last_cap = self._cap_arr.pop()
+                last_alloc = self._alloc_arr.pop()
+                if last_rid != resource_id:
+                    self._rid_to_idx[last_rid] = idx
+                    self._idx_to_rid[idx] = last_rid
+                    self._cap_arr[idx] = last_cap
+                    self._alloc_arr[idx] = last_alloc
             logger.info(f"Removed resource: {resource.name}")
             return True
     
+    def _on_resource_change(self, resource: Resource, amount: float):
+        """Mirror an allocation delta into the allocated column"""
+        with self._arr_lock:
+            self._alloc_arr[self._rid_to_idx[resource.resource_id]] += amount
+    
     def create_pool(self, name: str, description: str = "") -> ResourcePool:
         """
         Create a new resource pool.
@@ -375,8 +591,9 @@ class ResourceManager:
             
             resource = self.resources[resource_id]
             pool = self.pools[pool_name]
-            
-            return pool.add_resource(resource)
+        
+        # Outside the manager lock: the pool takes the resource's lock
+        return pool.add_resource(resource)
     
     def allocate_resources(self, task_id: str, resource_requirements: Dict[str, float]) -> bool:
         """
@@ -389,33 +606,132 @@ class ResourceManager:
         Returns:
             True if all allocations were successful
         """
+        # Resolve resources up front; sorting by ID gives a global lock order
         with self.lock:
-            # Check if all resources are available
-            for resource_id, amount in resource_requirements.items():
-                if resource_id not in self.resources:
+            resolved = []
+            for resource_id in sorted(resource_requirements):
+                resource = self.resources.get(resource_id)
+                if resource is None:
                     logger.error(f"Resource {resource_id} not found for task {task_id}")
                     return False
+                resolved.append((resource, resource_requirements[resource_id]))
+        
+        with ExitStack() as stack:
+            self._acquire_locks(stack, [resource for resource, _ in resolved])
+            
+            # Validate everything first; with the locks held nothing can change
+            # underneath us, so the commit pass below cannot fail
+            for resource, amount in resolved:
+                if self.resources.get(resource.resource_id) is not resource:
+                    logger.error(f"Resource {resource.resource_id} not found for task {task_id}")
+                    return False
                 
-                resource = self.resources[resource_id]
-                if not resource.is_available(amount):
+                if resource.available < amount:
                     logger.warning(f"Insufficient {resource.name} for task {task_id}")
-                    self.stats["allocation_failures"] += 1
+                    with self.lock:
+                        self._stats[Stat.ALLOC_FAIL] += 1
                     return False
             
-            # Perform allocations
-            for resource_id, amount in resource_requirements.items():
-                resource = self.resources[resource_id]
-                if not resource.allocate(amount, task_id):
-                    # Rollback previous allocations
-                    self._rollback_allocations(task_id)
-                    return False
+            # Commit all allocations in a single pass
+            self._commit_allocations(resolved, datetime.now())
             
             # Record allocations
-            self.allocations[task_id] = resource_requirements.copy()
-            self.stats["total_allocations"] += 1
+            with self.lock:
+                self._record_allocations(task_id, resolved)
+                self._stats[Stat.ALLOC] += 1
+        
+        if logger.isEnabledFor(TRACE):
+            logger.log(TRACE, "Allocated resources for task %s: %s", task_id, resource_requirements)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Allocated %d resources for task %s", len(resolved), task_id)
+        return True
+    
+    def allocate_many(self, requests: List[Tuple[str, Dict[str, float]]]) -> List[bool]:
+        """
+        Allocate resources for a batch of tasks in one pass.
+        
+        Requests are admitted in order, exactly as if allocate_resources had
+        been called for each one, but all involved resources are locked once
+        and the availability checks run in a single (JIT-compiled when Numba
+        is installed) kernel.
+        
+        Args:
+            requests: List of (task_id, resource_requirements) pairs
             
-            logger.info(f"Allocated resources for task {task_id}: {resource_requirements}")
-            return True
+        Returns:
+            List of booleans, True for each request that was allocated
+        """
+        results = [False] * len(requests)
+        
+        # Resolve resources and flatten requests into kernel inputs;
+        # positions index the batch's own resources, not self.resources
+        with self.lock:
+            positions: Dict[str, int] = {}
+            batch_resources: List[Resource] = []
+            batch = []  # position in requests of each kernel request
+            offsets = [0]
+            indices = []
+            amounts = []
+            for position, (task_id, resource_requirements) in enumerate(requests):
+                missing = next((resource_id for resource_id in resource_requirements
+                                if resource_id not in self.resources), None)
+                if missing is not None:
+                    logger.error(f"Resource {missing} not found for task {task_id}")
+                    continue
+                
+                for resource_id, amount in resource_requirements.items():
+                    if resource_id not in positions:
+                        positions[resource_id] = len(batch_resources)
+                        batch_resources.append(self.resources[resource_id])
+                    indices.append(positions[resource_id])
+                    amounts.append(amount)
+                offsets.append(len(indices))
+                batch.append(position)
+        
+        if not batch:
+            return results
+        
+        with ExitStack() as stack:
+            self._acquire_locks(stack, sorted(batch_resources, key=lambda r: r.resource_id))
+            
+            if any(self.resources.get(r.resource_id) is not r for r in batch_resources):
+                # A resource was removed while we waited; take the scalar path
+                stack.close()
+                return [self.allocate_resources(task_id, resource_requirements)
+                        for task_id, resource_requirements in requests]
+            
+            available = [r.available for r in batch_resources]
+            if NUMBA_AVAILABLE:
+                accepted = np.zeros(len(batch), dtype=np.bool_)
+                _fit_batch(np.array(offsets, dtype=np.int64), np.array(indices, dtype=np.int64),
+                           np.array(amounts, dtype=np.float64),
+                           np.array(available, dtype=np.float64), accepted)
+                accepted = accepted.tolist()
+            else:
+                accepted = [False] * len(batch)
+                _fit_batch(offsets, indices, amounts, available, accepted)
+            
+            now = datetime.now()
+            admitted = []
+            for r, position in enumerate(batch):
+                if not accepted[r]:
+                    continue
+                resolved = [(batch_resources[indices[k]], amounts[k])
+                            for k in range(offsets[r], offsets[r + 1])]
+                self._commit_allocations(resolved, now)
+                admitted.append((requests[position][0], resolved))
+                results[position] = True
+            
+            with self.lock:
+                for task_id, resolved in admitted:
+                    self._record_allocations(task_id, resolved)
+                self._stats[Stat.ALLOC] += len(admitted)
+                self._stats[Stat.ALLOC_FAIL] += len(batch) - len(admitted)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Allocated resources for %d of %d batched tasks",
+                         len(admitted), len(requests))
+        return results
     
     def deallocate_resources(self, task_id: str) -> bool:
         """
@@ -428,58 +744,288 @@ class ResourceManager:
             True if deallocation was successful
         """
         with self.lock:
-            if task_id not in self.allocations:
+            record = self._alloc_index.get(task_id)
+            if record is None:
                 logger.warning(f"No allocations found for task {task_id}")
                 return False
+            rows = record.rows
+            
+            resolved = sorted((self._alloc_rid[i], self._alloc_amt[i]) for i in rows)
+            resolved = [(resource_id, self.resources.get(resource_id), amount)
+                        for resource_id, amount in resolved]
+        
+        with ExitStack() as stack:
+            self._acquire_locks(stack, [resource for _, resource, _ in resolved])
+            
+            # Erase the ledger entry before releasing any amount, while the
+            # resource locks are still held: nobody can observe the amounts
+            # freed while the ledger still claims them, and a concurrent
+            # release of the same task finds nothing to do
+            with self.lock:
+                # Another caller may have released (or re-allocated) this task
+                # while we waited; every allocation installs a fresh row list
+                record = self._alloc_index.get(task_id)
+                if record is None or record.rows is not rows:
+                    logger.warning(f"No allocations found for task {task_id}")
+                    return False
+                
+                self._remove_rows(rows)
+                self._release_record(self._alloc_index.pop(task_id))
             
-            task_allocations = self.allocations[task_id]
             success = True
+            failures = 0
             
-            for resource_id, amount in task_allocations.items():
-                if resource_id in self.resources:
-                    resource = self.resources[resource_id]
+            for resource_id, resource, amount in resolved:
+                if resource is not None:
                     if not resource.deallocate(amount, task_id):
                         success = False
-                        self.stats["deallocation_failures"] += 1
+                        failures += 1
                 else:
                     logger.warning(f"Resource {resource_id} not found during deallocation")
                     success = False
             
-            if success:
-                del self.allocations[task_id]
-                self.stats["total_deallocations"] += 1
-                logger.info(f"Deallocated resources for task {task_id}")
-            else:
-                logger.error(f"Failed to deallocate some resources for task {task_id}")
+            if __debug__ and logger.isEnabledFor(logging.DEBUG):
+                for resource_id, resource, _ in resolved:
+                    if resource is not None:
+                        drift = resource.available + resource.allocated - resource.capacity
+                        assert abs(drift) <= 1e-9 * resource.capacity, (
+                            f"Resource {resource_id} out of balance after releasing task {task_id}")
             
-            return success
+            with self.lock:
+                self._stats[Stat.DEALLOC_FAIL] += failures
+                if success:
+                    self._stats[Stat.DEALLOC] += 1
+        
+        if success:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Deallocated resources for task %s", task_id)
+        else:
+            logger.error(f"Failed to deallocate some resources for task {task_id}")
+        
+        return success
     
-    def _rollback_allocations(self, task_id: str):
-        """Rollback allocations for a task"""
-        if task_id in self.allocations:
-            task_allocations = self.allocations[task_id]
-            for resource_id, amount in task_allocations.items():
-                if resource_id in self.resources:
-                    resource = self.resources[resource_id]
-                    resource.deallocate(amount, task_id)
-            del self.allocations[task_id]
+    def deallocate_many(self, task_ids: List[str]) -> List[bool]:
+        """
+        Deallocate all resources for a batch of tasks in one pass.
+        
+        Equivalent to calling deallocate_resources for each task, but the
+        ledger is read and updated under one acquisition of the manager lock
+        and every involved resource is locked once for the whole batch.
+        
+        Args:
+            task_ids: IDs of the tasks to release
+            
+        Returns:
+            List of booleans, True for each task whose resources were all released
+        """
+        results = [False] * len(task_ids)
+        
+        # Snapshot each task's ledger rows, as deallocate_resources does
+        with self.lock:
+            batch = []  # (position, task_id, rows, [(resource_id, resource, amount)])
+            batch_resources: Dict[str, Resource] = {}
+            seen: Set[str] = set()
+            for position, task_id in enumerate(task_ids):
+                # A repeated id finds nothing left, like a second call would
+                record = self._alloc_index.get(task_id) if task_id not in seen else None
+                seen.add(task_id)
+                if record is None:
+                    logger.warning(f"No allocations found for task {task_id}")
+                    continue
+                rows = record.rows
+                resolved = []
+                for i in rows:
+                    resource_id = self._alloc_rid[i]
+                    resource = self.resources.get(resource_id)
+                    resolved.append((resource_id, resource, self._alloc_amt[i]))
+                    if resource is not None:
+                        batch_resources[resource_id] = resource
+                batch.append((position, task_id, rows, resolved))
+        
+        if not batch:
+            return results
+        
+        with ExitStack() as stack:
+            self._acquire_locks(stack, [batch_resources[rid] for rid in sorted(batch_resources)])
+            
+            # Erase the ledger entries before releasing any amount, skipping
+            # tasks another caller released or re-allocated while we waited
+            with self.lock:
+                released = []
+                stale_rows = []
+                for entry in batch:
+                    _, task_id, rows, _ = entry
+                    record = self._alloc_index.get(task_id)
+                    if record is None or record.rows is not rows:
+                        logger.warning(f"No allocations found for task {task_id}")
+                        continue
+                    stale_rows.extend(rows)
+                    released.append(entry)
+                
+                self._remove_rows(stale_rows)
+                for _, task_id, _, _ in released:
+                    self._release_record(self._alloc_index.pop(task_id))
+            
+            failures = 0
+            succeeded = 0
+            for position, task_id, _, resolved in released:
+                success = True
+                for resource_id, resource, amount in resolved:
+                    if resource is not None:
+                        if not resource.deallocate(amount, task_id):
+                            success = False
+                            failures += 1
+                    else:
+                        logger.warning(f"Resource {resource_id} not found during deallocation")
+                        success = False
+                if success:
+                    succeeded += 1
+                else:
+                    logger.error(f"Failed to deallocate some resources for task {task_id}")
+                results[position] = success
+            
+            with self.lock:
+                self._stats[Stat.DEALLOC_FAIL] += failures
+                self._stats[Stat.DEALLOC] += succeeded
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Deallocated resources for %d of %d batched tasks",
+                         succeeded, len(task_ids))
+        return results
+    
+    @staticmethod
+    def _commit_allocations(resolved: List[Tuple[Resource, float]], now: datetime):
+        """Apply validated allocations; caller holds every resource's lock"""
+        for resource, amount in resolved:
+            resource.available -= amount
+            resource.allocated += amount
+            resource.last_updated = now
+            for listener in resource._listeners:
+                listener(resource, amount)
+    
+    def _record_allocations(self, task_id: str, resolved: List[Tuple[Resource, float]]):
+        """Append ledger rows for a task; caller holds self.lock"""
+        start = len(self._alloc_task)
+        for resource, amount in resolved:
+            self._alloc_task.append(task_id)
+            self._alloc_rid.append(resource.resource_id)
+            self._alloc_amt.append(amount)
+        
+        new_rows = list(range(start, len(self._alloc_task)))
+        record = self._alloc_index.get(task_id)
+        if record is None:
+            record = self._free_head
+            if record is None:
+                record = _Allocation()
+            else:
+                self._free_head = record.next_free
+                record.next_free = None
+                self._free_count -= 1
+            record.task_id = task_id
+            record.rows = new_rows
+            self._alloc_index[task_id] = record
+        else:
+            # Replace rather than extend so concurrent readers holding the
+            # old row list can tell the ledger changed
+            record.rows = record.rows + new_rows
     
-    def get_available_resources(self, resource_type: Optional[ResourceType] = None) -> List[Resource]:
+    def _release_record(self, record: _Allocation):
+        """Return a ledger record to the free list; caller holds self.lock"""
+        record.task_id = None
+        record.rows = None
+        if self._free_count < FREE_LIST_LIMIT:
+            record.next_free = self._free_head
+            self._free_head = record
+            self._free_count += 1
+    
+    @staticmethod
+    def _acquire_locks(stack: ExitStack, resources: List[Optional[Resource]]):
+        """Enter each distinct resource's lock once, in the (resource_id-sorted) order given"""
+        previous = None
+        for resource in resources:
+            if resource is not None and resource is not previous:
+                stack.enter_context(resource._lock)
+            previous = resource
+    
+    def _remove_rows(self, rows: List[int]):
+        """Drop ledger rows by swapping in the last row; caller holds self.lock"""
+        tasks, rids, amounts = self._alloc_task, self._alloc_rid, self._alloc_amt
+        # Highest first, so the row swapped in never belongs to this task
+        for i in sorted(rows, reverse=True):
+            last = len(tasks) - 1
+            if i != last:
+                moved_task = tasks[last]
+                tasks[i] = moved_task
+                rids[i] = rids[last]
+                amounts[i] = amounts[last]
+                moved_rows = self._alloc_index[moved_task].rows
+                moved_rows[moved_rows.index(last)] = i
+            tasks.pop()
+            rids.pop()
+            amounts.pop()
+    
+    @property
+    def stats(self) -> Dict[str, int]:
         """
-        Get all available resources, optionally filtered by type.
+        Allocation counters by name.
+        
+        Returns:
+            Dictionary snapshot of the counters
+        """
+        with self.lock:
+            counters = tuple(self._stats)
+        return dict(zip(_STAT_NAMES, counters))
+    
+    @property
+    def allocations(self) -> Dict[str, Dict[str, float]]:
+        """
+        Current allocations as task_id -> {resource_id: amount}.
+        
+        Returns:
+            Dictionary built from the allocation ledger
+        """
+        with self.lock:
+            rows = list(zip(self._alloc_task, self._alloc_rid, self._alloc_amt))
+            allocations: Dict[str, Dict[str, float]] = {task_id: {} for task_id in self._alloc_index}
+        
+        for task_id, resource_id, amount in rows:
+            task_allocations = allocations[task_id]
+            task_allocations[resource_id] = task_allocations.get(resource_id, 0.0) + amount
+        return allocations
+    
+    def get_available_resources(self, resource_type: Optional[ResourceType] = None) -> Iterator[Resource]:
+        """
+        Iterate over available resources, optionally filtered by type.
+        
+        The resource table is snapshotted when this is called; availability
+        is checked lazily as the iterator is consumed, so callers that only
+        need the first match don't pay for the rest.
         
         Args:
             resource_type: Optional resource type filter
             
         Returns:
-            List of available resources
+            Iterator over available resources
         """
         with self.lock:
             if resource_type is None:
-                return [r for r in self.resources.values() if r.available > 0]
+                snapshot = tuple(self.resources.values())
             else:
-                return [r for r in self.resources.values() 
-                       if r.resource_type == resource_type and r.available > 0]
+                snapshot = tuple(self._by_type.get(resource_type.code, {}).values())
+        
+        return (r for r in snapshot if r.available > 0)
+    
+    def get_available_resources_list(self, resource_type: Optional[ResourceType] = None) -> List[Resource]:
+        """
+        Get all available resources, optionally filtered by type.
+        
+        Args:
+            resource_type: Optional resource type filter
+            
+        Returns:
+            List of available resources
+        """
+        return list(self.get_available_resources(resource_type))
     
     def get_resource_utilization(self) -> Dict[str, float]:
         """
@@ -488,9 +1034,50 @@ class ResourceManager:
         Returns:
             Dictionary mapping resource IDs to utilization percentages
         """
-        with self.lock:
-            return {resource_id: resource.get_utilization() 
-                   for resource_id, resource in self.resources.items()}
+        with self._arr_lock:
+            resource_ids = list(self._idx_to_rid)
+            if NUMPY_AVAILABLE and len(resource_ids) >= VECTORIZE_THRESHOLD:
+                allocated = np.array(self._alloc_arr)
+                capacity = np.array(self._cap_arr)
+            else:
+                allocated = self._alloc_arr.tolist()
+                capacity = self._cap_arr.tolist()
+        
+        if isinstance(allocated, list):
+            return {resource_id: amount / total
+                    for resource_id, amount, total in zip(resource_ids, allocated, capacity)}
+        return dict(zip(resource_ids, (allocated / capacity).tolist()))
+    
+    def add_conflict_listener(self, listener: Callable[[], None]):
+        """
+        Register a callback for note_conflict.
+        
+        Args:
+            listener: Called with no arguments, possibly from another thread
+        """
+        self._conflict_listeners.append(listener)
+    
+    def remove_conflict_listener(self, listener: Callable[[], None]):
+        """
+        Unregister a callback added with add_conflict_listener.
+        
+        Args:
+            listener: Callback to remove
+        """
+        if listener in self._conflict_listeners:
+            self._conflict_listeners.remove(listener)
+    
+    def note_conflict(self):
+        """
+        Record that a resource conflict may need resolving and notify the
+        conflict listeners. Safe to call from any thread; listeners must be
+        too.
+        """
+        for listener in tuple(self._conflict_listeners):
+            try:
+                listener()
+            except Exception as e:
+                logger.error(f"Error in resource conflict listener: {e}")
     
     def resolve_conflicts(self) -> int:
         """
@@ -499,18 +1086,12 @@ class ResourceManager:
         Returns:
             Number of conflicts resolved
         """
-        with self.lock:
-            conflicts_resolved = 0
-            
-            # Simple conflict resolution: identify tasks with overdue deadlines
-            # and preempt their resources if necessary
-            for task_id, allocations in self.allocations.items():
-                # This is a simplified conflict resolution
-                # In a real system, you'd implement more sophisticated deadlock detection
-                pass
-            
-            self.stats["conflicts_resolved"] += conflicts_resolved
-            return conflicts_resolved
+        # No conflict detection is implemented yet, so there is nothing to
+        # resolve. Real detection should take self.lock only on the branch
+        # that actually preempts, keeping the common no-conflict path
+        # lock-free, count resolutions in self._stats[Stat.CONFLICTS], and
+        # call note_conflict when it records a conflict.
+        return 0
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -519,41 +1100,58 @@ class ResourceManager:
         Returns:
             Dictionary containing statistics
         """
+        # Grab references and counters only; the dict is built after the
+        # lock is released so monitoring never stalls allocations
         with self.lock:
-            stats = self.stats.copy()
-            stats.update({
-                "total_resources": len(self.resources),
-                "total_pools": len(self.pools),
-                "active_allocations": len(self.allocations),
-                "resource_utilization": self.get_resource_utilization()
-            })
-            return stats
+            counters = tuple(self._stats)
+            total_resources = len(self.resources)
+            total_pools = len(self.pools)
+            active_allocations = len(self._alloc_index)
+        
+        stats = dict(zip(_STAT_NAMES, counters))
+        stats.update({
+            "total_resources": total_resources,
+            "total_pools": total_pools,
+            "active_allocations": active_allocations,
+            # get_resource_utilization takes its own snapshot
+            "resource_utilization": self.get_resource_utilization()
+        })
+        return stats
     
     def get_allocation_summary(self) -> Dict[str, Any]:
         """
         Get a summary of current allocations.
         
         Returns:
-            Dictionary containing allocation summary
+            Dictionary containing allocation summary; ``allocations_by_task``
+            maps each task ID to a tuple of (resource_id, amount) pairs
         """
         with self.lock:
+            # Per-task (resource_id, amount) tuples read straight off the
+            # ledger; immutable, so they can be handed out without copying
+            rids, amounts = self._alloc_rid, self._alloc_amt
             summary = {
-                "total_allocated_tasks": len(self.allocations),
-                "allocations_by_task": {},
+                "total_allocated_tasks": len(self._alloc_index),
+                "allocations_by_task": {
+                    task_id: tuple((rids[i], amounts[i]) for i in record.rows)
+                    for task_id, record in self._alloc_index.items()
+                },
                 "resource_usage": {}
             }
             
-            for task_id, allocations in self.allocations.items():
-                summary["allocations_by_task"][task_id] = allocations.copy()
-            
-            for resource_id, resource in self.resources.items():
-                summary["resource_usage"][resource_id] = {
-                    "name": resource.name,
-                    "type": resource.resource_type.value,
-                    "capacity": resource.capacity,
-                    "allocated": resource.allocated,
-                    "available": resource.available,
-                    "utilization": resource.get_utilization()
-                }
-            
-            return summary
\ No newline at end of file
+            resources = tuple(self.resources.items())
+        
+        # Per-resource figures are read outside the lock; they may lag a
+        # concurrent allocation slightly, which a summary can tolerate
+        resource_usage = summary["resource_usage"]
+        for resource_id, resource in resources:
+            resource_usage[resource_id] = {
+                "name": resource.name,
+                "type": resource._type_str,
+                "capacity": resource.capacity,
+                "allocated": resource.allocated,
+                "available": resource.available,
+                "utilization": resource.get_utilization()
+            }
+        
+        return summary
\ No newline at end of file
@@ -4,14 +4,180 @@ This module provides different scheduling algorithms for task execution.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from datetime import datetime
+from collections import deque
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+import heapq
+import itertools
 import logging
+import math
+import queue
+import threading
+import time
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from .task import Task, TaskPriority, TaskState
 
 logger = logging.getLogger(__name__)
 
+# Below this many ready tasks a plain loop beats the NumPy call overhead
+VECTORIZE_THRESHOLD = 64
+
+# Deadline scoring: bonus added once a task is overdue, and the floor on the
+# remaining time so the proximity term stays finite without a branch
+OVERDUE_BONUS = 1000.0
+_EPS = 1e-9
+
+
+def _deadline_argmax(deadlines, priorities, seqs, count, now_ts, deadline_weight, priority_weight):
+    """
+    Score the first ``count`` rows of the deadline columns and return the
+    (row, score) of the best one. Equal scores go to the lowest insertion
+    sequence number, i.e. the task that became ready first.
+    
+    Same formula as DeadlineAlgorithm._score_tasks, fused into one loop
+    so no temporary arrays are built. Rows without a deadline hold inf.
+    """
+    best_row = 0
+    best_score = 0.0
+    for row in range(count):
+        remaining = deadlines[row] - now_ts
+        if remaining == math.inf:
+            score = 0.1
+        else:
+            score = (deadline_weight / (max(remaining, _EPS) + 1.0)
+                     + OVERDUE_BONUS * (remaining <= 0.0))
+        score += priority_weight * priorities[row]
+        if row == 0 or score > best_score or (score == best_score and seqs[row] < seqs[best_row]):
+            best_row = row
+            best_score = score
+    return best_row, best_score
+
+
+if NUMBA_AVAILABLE:
+    _deadline_argmax = njit(cache=True)(_deadline_argmax)
+
+
+class TaskHeap:
+    """
+    Binary min-heap of tasks with lazy deletion.
+    
+    Follows the priority-queue recipe from the heapq documentation: each entry
+    is a mutable [priority, count, push_id, task] list, entries are looked up
+    by task_id through an entry finder, and removal just marks the entry so
+    pop can skip it. The insertion count breaks ties so equal priorities pop
+    in FIFO order; push_id is unique per push, so a re-pushed task's live and
+    removed entries never tie and tasks are never compared.
+    """
+    
+    _REMOVED = None  # placeholder for a removed task
+    
+    def __init__(self):
+        """Initialize an empty heap"""
+        self._heap: List[list] = []
+        self._entry_finder: Dict[str, list] = {}  # task_id -> entry
+        self._counter = itertools.count()
+        self._push_ids = itertools.count()
+    
+    def __len__(self) -> int:
+        return len(self._entry_finder)
+    
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._entry_finder
+    
+    def push(self, task: Task, priority: float, count: Optional[int] = None):
+        """
+        Add a task, or update its priority if already present. An updated
+        task keeps its original insertion count, and with it its place among
+        equal priorities.
+        
+        Args:
+            task: Task to add
+            priority: Heap key; lower values are popped first
+            count: Insertion count to reuse for a task that was popped and
+                is being put back (as returned by pop_counted)
+        """
+        old_entry = self._entry_finder.get(task.task_id)
+        if old_entry is not None:
+            count = old_entry[1]
+            self.remove(task.task_id)
+        elif count is None:
+            count = next(self._counter)
+        entry = [priority, count, next(self._push_ids), task]
+        self._entry_finder[task.task_id] = entry
+        heapq.heappush(self._heap, entry)
+    
+    def remove(self, task_id: str) -> bool:
+        """
+        Remove a task from the heap.
+        
+        Args:
+            task_id: ID of the task to remove
+            
+        Returns:
+            True if the task was present
+        """
+        entry = self._entry_finder.pop(task_id, None)
+        if entry is None:
+            return False
+        entry[-1] = self._REMOVED
+        return True
+    
+    def pop(self) -> Optional[Task]:
+        """
+        Remove and return the task with the lowest priority value.
+        
+        Returns:
+            The task, or None if the heap is empty
+        """
+        popped = self.pop_counted()
+        return popped[0] if popped is not None else None
+    
+    def pop_counted(self) -> Optional[Tuple[Task, int]]:
+        """
+        Remove the task with the lowest priority value and return it with
+        its insertion count.
+        
+        Returns:
+            (task, count), or None if the heap is empty
+        """
+        heap = self._heap
+        while heap:
+            entry = heapq.heappop(heap)
+            task = entry[-1]
+            if task is not self._REMOVED:
+                del self._entry_finder[task.task_id]
+                return task, entry[1]
+        return None
+    
+    def peek(self) -> Optional[Task]:
+        """
+        Return the task with the lowest priority value without removing it.
+        
+        Returns:
+            The task, or None if the heap is empty
+        """
+        heap = self._heap
+        while heap and heap[0][-1] is self._REMOVED:
+            heapq.heappop(heap)
+        return heap[0][-1] if heap else None
+    
+    def clear(self):
+        """Remove all tasks"""
+        self._heap.clear()
+        self._entry_finder.clear()
+
 
 class SchedulingAlgorithm(ABC):
     """
@@ -34,6 +200,9 @@ class SchedulingAlgorithm(ABC):
             "total_scheduling_time": 0.0,
             "average_scheduling_time": 0.0
         }
+        # Ready set for the incremental API (add_ready_task/pop_next_task);
+        # subclasses that keep their own structure leave it empty
+        self._ready: Dict[str, Task] = {}
     
     @abstractmethod
     def select_next_task(self, ready_tasks: List[Task]) -> Optional[Task]:
@@ -48,14 +217,134 @@ class SchedulingAlgorithm(ABC):
         """
         pass
     
-    def update_stats(self, scheduling_time: float):
+    def add_ready_task(self, task: Task):
+        """
+        Register a task as ready for pop_next_task.
+        
+        Args:
+            task: Task that became ready
+        """
+        self._ready[task.task_id] = task
+    
+    def remove_ready_task(self, task: Task) -> bool:
+        """
+        Unregister a ready task without selecting it.
+        
+        Args:
+            task: Task to remove
+            
+        Returns:
+            True if the task was registered
+        """
+        return self._ready.pop(task.task_id, None) is not None
+    
+    def requeue_task(self, task: Task):
+        """
+        Put back the task the last pop_next_task returned when it could not
+        be started, restoring the place it had rather than queueing it anew.
+        
+        The default ready set has no order to restore, so this simply
+        re-adds the task.
+        
+        Args:
+            task: Task returned by the last pop_next_task
+        """
+        self.add_ready_task(task)
+    
+    def update_ready_task(self, task: Task) -> bool:
+        """
+        Refresh a ready task after its priority or deadline changed.
+        
+        Only the changed task is rescored, keeping its place in any
+        incremental structure. The default ready set scores tasks on demand,
+        so there is nothing to refresh.
+        
+        Args:
+            task: Task whose scheduling inputs changed
+            
+        Returns:
+            True if the task is registered as ready
+        """
+        return task.task_id in self._ready
+    
+    def pop_next_task(self) -> Optional[Task]:
+        """
+        Select and unregister the next task among those added with
+        add_ready_task.
+        
+        The default implementation rescans the whole ready set through
+        select_next_task; algorithms with an incremental structure override it.
+        
+        Returns:
+            The selected task, or None if no task should be executed
+        """
+        if not self._ready:
+            return None
+        task = self.select_next_task(list(self._ready.values()))
+        if task is not None:
+            del self._ready[task.task_id]
+        return task
+    
+    def select_next_tasks(self, ready_tasks: List[Task], k: int = 1) -> List[Task]:
+        """
+        Select up to k tasks to execute, best first.
+        
+        The default implementation calls select_next_task repeatedly on the
+        remaining tasks; algorithms that can rank in one pass override it.
+        
+        Args:
+            ready_tasks: List of tasks that are ready for execution
+            k: Maximum number of tasks to select
+            
+        Returns:
+            The selected tasks in execution order
+        """
+        remaining = list(ready_tasks)
+        selected = []
+        while remaining and len(selected) < k:
+            task = self.select_next_task(remaining)
+            if task is None:
+                break
+            selected.append(task)
+            remaining.remove(task)
+        return selected
+    
+    def pop_next_tasks(self, k: int) -> List[Task]:
+        """
+        Select and unregister up to k tasks added with add_ready_task.
+        
+        Args:
+            k: Maximum number of tasks to select
+            
+        Returns:
+            The selected tasks in execution order
+        """
+        selected = []
+        while len(selected) < k:
+            task = self.pop_next_task()
+            if task is None:
+                break
+            selected.append(task)
+        return selected
+    
+    def ready_count(self) -> int:
+        """
+        Get the number of tasks registered with add_ready_task.
+        
+        Returns:
+            Number of registered ready tasks
+        """
+        return len(self._ready)
+    
+    def update_stats(self, scheduling_time: float, count: int = 1):
         """
         Update algorithm statistics.
         
         Args:
-            scheduling_time: Time taken for the last scheduling decision
+            scheduling_time: Time taken for the last scheduling decision(s)
+            count: Number of tasks scheduled in that time
         """
-        self.stats["tasks_scheduled"] += 1
+        self.stats["tasks_scheduled"] += count
         self.stats["total_scheduling_time"] += scheduling_time
         self.stats["average_scheduling_time"] = (
             self.stats["total_scheduling_time"] / self.stats["tasks_scheduled"]
@@ -96,8 +385,18 @@ class RoundRobinAlgorithm(SchedulingAlgorithm):
         """
         super().__init__("Round Robin")
         self.time_slice = time_slice
+        self._time_slice_ns = int(time_slice * 1e9)
         self.current_index = 0
-        self.last_execution_time = {}  # task_id -> last execution time
+        self.last_execution_time = {}  # task_id -> last execution time (time.monotonic_ns())
+        
+        # Incremental ready queue in arrival order. Entries are [task] lists so
+        # remove_ready_task can blank one in place; _queued maps task_id to the
+        # live entry.
+        self._ready_queue: deque = deque()
+        self._queued: Dict[str, list] = {}
+        # (task_id, its last execution time before the pop) of the last
+        # popped task, for requeue_task
+        self._last_popped: Optional[tuple] = None
     
     def select_next_task(self, ready_tasks: List[Task]) -> Optional[Task]:
         """
@@ -112,21 +411,28 @@ class RoundRobinAlgorithm(SchedulingAlgorithm):
         if not ready_tasks:
             return None
         
-        current_time = datetime.now()
+        now_ns = time.monotonic_ns()
+        time_slice_ns = self._time_slice_ns
+        last_execution_time = self.last_execution_time
         
         # Filter tasks that haven't exceeded their time slice
-        eligible_tasks = []
-        for task in ready_tasks:
-            last_exec = self.last_execution_time.get(task.task_id)
-            if last_exec is None:
-                eligible_tasks.append(task)
-            elif (current_time - last_exec).total_seconds() >= self.time_slice:
-                eligible_tasks.append(task)
+        if len(last_execution_time) < len(ready_tasks):
+            # Fewer recorded runs than ready tasks: collect the IDs still
+            # inside their slice and filter against that set
+            in_slice = {task_id for task_id, last_exec in last_execution_time.items()
+                        if now_ns - last_exec < time_slice_ns}
+            eligible_tasks = [task for task in ready_tasks if task.task_id not in in_slice]
+        else:
+            # A task that never ran defaults to exactly one slice ago
+            get_last_exec = last_execution_time.get
+            never_ran = now_ns - time_slice_ns
+            eligible_tasks = [task for task in ready_tasks
+                              if now_ns - get_last_exec(task.task_id, never_ran) >= time_slice_ns]
         
         if not eligible_tasks:
             # If no tasks are eligible, reset and use all ready tasks
             eligible_tasks = ready_tasks
-            self.last_execution_time.clear()
+            last_execution_time.clear()
         
         # Select task in round-robin order
         if self.current_index >= len(eligible_tasks):
@@ -136,10 +442,127 @@ class RoundRobinAlgorithm(SchedulingAlgorithm):
         self.current_index = (self.current_index + 1) % len(eligible_tasks)
         
         # Update last execution time
-        self.last_execution_time[selected_task.task_id] = current_time
+        last_execution_time[selected_task.task_id] = now_ns
         
         logger.debug(f"Round-robin selected task: {selected_task.name}")
         return selected_task
+    
+    def add_ready_task(self, task: Task):
+        """
+        Append a task to the back of the round-robin queue.
+        
+        Args:
+            task: Task that became ready
+        """
+        if task.task_id not in self._queued:
+            entry = [task]
+            self._queued[task.task_id] = entry
+            self._ready_queue.append(entry)
+    
+    def remove_ready_task(self, task: Task) -> bool:
+        """
+        Remove a task from the round-robin queue.
+        
+        Args:
+            task: Task to remove
+            
+        Returns:
+            True if the task was queued
+        """
+        entry = self._queued.pop(task.task_id, None)
+        if entry is None:
+            return False
+        entry[0] = None
+        return True
+    
+    def update_ready_task(self, task: Task) -> bool:
+        """
+        Refresh a queued task; round-robin order ignores priority and
+        deadline, so this only reports whether the task is queued.
+        
+        Args:
+            task: Task whose scheduling inputs changed
+            
+        Returns:
+            True if the task is queued
+        """
+        return task.task_id in self._queued
+    
+    def pop_next_task(self) -> Optional[Task]:
+        """
+        Take the first queued task whose time slice has elapsed, rotating
+        ineligible tasks to the back.
+        
+        Returns:
+            The selected task, or None if the queue is empty
+        """
+        queue = self._ready_queue
+        if not self._queued:
+            queue.clear()
+            return None
+        
+        now_ns = time.monotonic_ns()
+        time_slice_ns = self._time_slice_ns
+        last_execution_time = self.last_execution_time
+        
+        selected_task = None
+        for _ in range(len(queue)):
+            task = queue[0][0]
+            if task is None:
+                # Removed while queued
+                queue.popleft()
+                continue
+            last_exec = last_execution_time.get(task.task_id)
+            if last_exec is None or now_ns - last_exec >= time_slice_ns:
+                selected_task = task
+                break
+            queue.rotate(-1)
+        
+        if selected_task is None:
+            # No task is eligible: reset and take the head, like
+            # select_next_task. The full rotation dropped every removed entry.
+            last_execution_time.clear()
+            selected_task = queue[0][0]
+        
+        queue.popleft()
+        del self._queued[selected_task.task_id]
+        self._last_popped = (selected_task.task_id, last_execution_time.get(selected_task.task_id))
+        last_execution_time[selected_task.task_id] = now_ns
+        
+        logger.debug(f"Round-robin selected task: {selected_task.name}")
+        return selected_task
+    
+    def requeue_task(self, task: Task):
+        """
+        Put the last popped task back at the head of the queue with its
+        previous execution time, as if it had not been selected.
+        
+        Args:
+            task: Task returned by the last pop_next_task
+        """
+        last_popped = self._last_popped
+        if last_popped is None or last_popped[0] != task.task_id or task.task_id in self._queued:
+            self.add_ready_task(task)
+            return
+        self._last_popped = None
+        
+        last_exec = last_popped[1]
+        if last_exec is None:
+            self.last_execution_time.pop(task.task_id, None)
+        else:
+            self.last_execution_time[task.task_id] = last_exec
+        entry = [task]
+        self._queued[task.task_id] = entry
+        self._ready_queue.appendleft(entry)
+    
+    def ready_count(self) -> int:
+        """
+        Get the number of queued ready tasks.
+        
+        Returns:
+            Number of queued ready tasks
+        """
+        return len(self._queued)
 
 
 class PriorityAlgorithm(SchedulingAlgorithm):
@@ -160,6 +583,18 @@ class PriorityAlgorithm(SchedulingAlgorithm):
         super().__init__("Priority Based")
         self.aging_factor = aging_factor
         self.task_wait_times = {}  # task_id -> wait time
+        
+        # Incremental path. A task's aged priority is its base priority plus
+        # aging_factor for every selection it has waited through, and every
+        # queued task ages at the same rate, so the order only depends on
+        # base - enqueue_tick * aging_factor: the heap key is fixed at push.
+        self._heap = TaskHeap()
+        self._tick = 0  # selections made through pop_next_task
+        # task_id -> (enqueue tick, task._version the heap key was built from)
+        self._queued: Dict[str, tuple] = {}
+        # (task_id, enqueue tick, heap insertion count) of the last popped
+        # task, for requeue_task
+        self._last_popped: Optional[tuple] = None
     
     def select_next_task(self, ready_tasks: List[Task]) -> Optional[Task]:
         """
@@ -174,38 +609,182 @@ class PriorityAlgorithm(SchedulingAlgorithm):
         if not ready_tasks:
             return None
         
-        current_time = datetime.now()
+        wait_times = self.task_wait_times
+        aging_factor = self.aging_factor
         
-        # Calculate effective priority for each task
-        task_priorities = []
+        # Single pass: score each task by aged priority, track the best one,
+        # and age every task's wait time as we go. Strict > keeps the first
+        # of equally scored tasks, as the old stable sort did. Tasks announced
+        # through add_ready_task are already seeded, so the lookup only misses
+        # for tasks seen here for the first time.
+        selected_task = None
+        best_priority = 0.0
         for task in ready_tasks:
-            # Get base priority
-            base_priority = task.priority.value
-            
-            # Apply aging (increase priority based on wait time)
-            wait_time = self.task_wait_times.get(task.task_id, 0.0)
-            aged_priority = base_priority + (wait_time * self.aging_factor)
+            task_id = task.task_id
+            try:
+                wait_time = wait_times[task_id]
+            except KeyError:
+                aged_priority = task._priority_int
+                wait_times[task_id] = 0.0
+            else:
+                aged_priority = task._priority_int + wait_time * aging_factor
+                wait_times[task_id] = wait_time + 1.0
             
-            task_priorities.append((task, aged_priority))
+            if selected_task is None or aged_priority > best_priority:
+                selected_task = task
+                best_priority = aged_priority
         
-        # Sort by effective priority (highest first)
-        task_priorities.sort(key=lambda x: x[1], reverse=True)
+        # Reset wait time for selected task
+        wait_times[selected_task.task_id] = 0.0
         
-        selected_task = task_priorities[0][0]
+        logger.debug(f"Priority algorithm selected task: {selected_task.name} "
+                    f"(priority: {selected_task.priority.name})")
+        return selected_task
+    
+    def select_next_tasks(self, ready_tasks: List[Task], k: int = 1) -> List[Task]:
+        """
+        Select the k tasks with the highest aged priority in one
+        O(n log k) pass, aging wait times as select_next_task does.
         
-        # Update wait times
+        Args:
+            ready_tasks: List of tasks that are ready for execution
+            k: Maximum number of tasks to select
+            
+        Returns:
+            The selected tasks, highest aged priority first
+        """
+        if not ready_tasks or k <= 0:
+            return []
+        
+        wait_times = self.task_wait_times
+        aging_factor = self.aging_factor
+        
+        # One pass over the tasks scores and ages them together, exactly as
+        # in select_next_task; ranking then only touches the (task, score) pairs
+        task_priorities = []
         for task in ready_tasks:
-            if task.task_id not in self.task_wait_times:
-                self.task_wait_times[task.task_id] = 0.0
+            task_id = task.task_id
+            try:
+                wait_time = wait_times[task_id]
+            except KeyError:
+                task_priorities.append((task, task._priority_int))
+                wait_times[task_id] = 0.0
             else:
-                self.task_wait_times[task.task_id] += 1.0
+                task_priorities.append((task, task._priority_int + wait_time * aging_factor))
+                wait_times[task_id] = wait_time + 1.0
         
-        # Reset wait time for selected task
-        self.task_wait_times[selected_task.task_id] = 0.0
+        selected_tasks = [task for task, _ in heapq.nlargest(k, task_priorities, key=itemgetter(1))]
+        for task in selected_tasks:
+            wait_times[task.task_id] = 0.0
+        
+        logger.debug(f"Priority algorithm selected {len(selected_tasks)} tasks")
+        return selected_tasks
+    
+    def add_ready_task(self, task: Task):
+        """
+        Push a task onto the priority heap and start its wait time. Adding a
+        task that is already queued re-keys it like update_ready_task.
+        
+        Args:
+            task: Task that became ready
+        """
+        queued = self._queued.get(task.task_id)
+        tick = queued[0] if queued is not None else self._tick
+        self._push(task, tick)
+        self.task_wait_times.setdefault(task.task_id, 0.0)
+    
+    def _push(self, task: Task, tick: int, count: Optional[int] = None):
+        """(Re)push a task with the key for its enqueue tick"""
+        self._queued[task.task_id] = (tick, task._version)
+        self._heap.push(task, tick * self.aging_factor - task._priority_int, count)
+    
+    def update_ready_task(self, task: Task) -> bool:
+        """
+        Re-key a queued task in O(log n) after its priority changed. The task
+        keeps its accumulated aging and its FIFO place among equal keys.
+        
+        Args:
+            task: Task whose scheduling inputs changed
+            
+        Returns:
+            True if the task is queued
+        """
+        queued = self._queued.get(task.task_id)
+        if queued is None:
+            return False
+        self._push(task, queued[0])
+        return True
+    
+    def remove_ready_task(self, task: Task) -> bool:
+        """
+        Remove a task from the priority heap and drop its wait time.
+        
+        Args:
+            task: Task to remove
+            
+        Returns:
+            True if the task was queued
+        """
+        self.task_wait_times.pop(task.task_id, None)
+        self._queued.pop(task.task_id, None)
+        return self._heap.remove(task.task_id)
+    
+    def pop_next_task(self) -> Optional[Task]:
+        """
+        Pop the task with the highest aged priority in O(log n).
+        
+        Keys are only recomputed for tasks that changed: a popped task whose
+        version moved on since it was pushed (set_priority without
+        update_ready_task) is re-keyed and the pop retried.
+        
+        Returns:
+            The selected task, or None if the heap is empty
+        """
+        heap = self._heap
+        queued = self._queued
+        while True:
+            popped = heap.pop_counted()
+            if popped is None:
+                return None
+            selected_task, count = popped
+            tick, version = queued.pop(selected_task.task_id)
+            if selected_task._version == version:
+                break
+            self._push(selected_task, tick, count)
+        self._tick += 1
+        self._last_popped = (selected_task.task_id, tick, count)
+        self.task_wait_times.pop(selected_task.task_id, None)
         
         logger.debug(f"Priority algorithm selected task: {selected_task.name} "
                     f"(priority: {selected_task.priority.name})")
         return selected_task
+    
+    def requeue_task(self, task: Task):
+        """
+        Push the last popped task back with its original enqueue tick and
+        insertion count, so it keeps its aging and FIFO place, and take back
+        the selection tick.
+        
+        Args:
+            task: Task returned by the last pop_next_task
+        """
+        last_popped = self._last_popped
+        if last_popped is None or last_popped[0] != task.task_id or task.task_id in self._queued:
+            self.add_ready_task(task)
+            return
+        self._last_popped = None
+        self._tick -= 1
+        self._push(task, last_popped[1], last_popped[2])
+        self.task_wait_times.setdefault(task.task_id, 0.0)
+    
+    def ready_count(self) -> int:
+        """
+        Get the number of tasks on the priority heap.
+        
+        Returns:
+            Number of queued ready tasks
+        """
+        return len(self._heap)
 
 
 class DeadlineAlgorithm(SchedulingAlgorithm):
@@ -227,6 +806,59 @@ class DeadlineAlgorithm(SchedulingAlgorithm):
         super().__init__("Deadline Based")
         self.deadline_weight = deadline_weight
         self.priority_weight = priority_weight
+        
+        # Incremental ready set, stored column-wise so large sets are scored in
+        # one NumPy expression: row i is _task_refs[i], with its deadline
+        # timestamp (inf if it has none) and priority in the NumPy columns.
+        # Columns grow by doubling; removal swaps the last row into the hole,
+        # so row order is not arrival order and _seqs (insertion sequence
+        # numbers) breaks score ties in FIFO order instead. _versions holds the
+        # task._version each row's columns were written from, so rows of tasks
+        # changed without update_ready_task are rewritten before scoring.
+        self._task_refs: List[Task] = []
+        self._rows: Dict[str, int] = {}  # task_id -> row
+        self._counter = itertools.count()
+        # (task_id, sequence number) of the last popped task, for requeue_task
+        self._last_popped: Optional[tuple] = None
+        if NUMPY_AVAILABLE:
+            self._deadlines = np.empty(16, dtype=np.float64)
+            self._priorities = np.empty(16, dtype=np.int8)
+            self._seqs = np.empty(16, dtype=np.int64)
+            self._versions = np.empty(16, dtype=np.int64)
+        else:
+            self._seqs: List[int] = []
+    
+    def _score_tasks(self, ready_tasks: List[Task]) -> List[tuple]:
+        """
+        Score ready tasks by deadline proximity and priority.
+        
+        Returns:
+            List of (task, score) pairs in input order
+        """
+        now_ts = time.time()
+        deadline_weight = self.deadline_weight
+        priority_weight = self.priority_weight
+        
+        # Calculate deadline scores for each task. Closer deadline = higher
+        # score; overdue tasks add OVERDUE_BONUS, selected by multiplying with
+        # the comparison rather than branching on it.
+        task_scores = []
+        for task in ready_tasks:
+            deadline_ts = task._deadline_ts
+            if deadline_ts is not None:
+                remaining_time = deadline_ts - now_ts
+                score = (deadline_weight / (max(remaining_time, _EPS) + 1.0)
+                         + OVERDUE_BONUS * (remaining_time <= 0.0))
+            else:
+                # No deadline, use a default score
+                score = 0.1
+            
+            # Priority component
+            score += priority_weight * task._priority_int
+            
+            task_scores.append((task, score))
+        
+        return task_scores
     
     def select_next_task(self, ready_tasks: List[Task]) -> Optional[Task]:
         """
@@ -241,58 +873,255 @@ class DeadlineAlgorithm(SchedulingAlgorithm):
         if not ready_tasks:
             return None
         
-        current_time = datetime.now()
+        task_scores = self._score_tasks(ready_tasks)
         
-        # Calculate deadline scores for each task
-        task_scores = []
-        for task in ready_tasks:
-            score = 0.0
+        # Highest score wins; max keeps the first of equal scores
+        selected_task, best_score = max(task_scores, key=itemgetter(1))
+        
+        logger.debug(f"Deadline algorithm selected task: {selected_task.name} "
+                    f"(deadline: {selected_task.deadline}, score: {best_score:.2f})")
+        return selected_task
+    
+    def select_next_tasks(self, ready_tasks: List[Task], k: int = 1) -> List[Task]:
+        """
+        Select the k highest scoring tasks in one O(n log k) pass.
+        
+        Args:
+            ready_tasks: List of tasks that are ready for execution
+            k: Maximum number of tasks to select
             
-            # Deadline component
-            if task.deadline:
-                remaining_time = (task.deadline - current_time).total_seconds()
-                if remaining_time <= 0:
-                    # Task is overdue, give it very high priority
-                    score += 1000.0
-                else:
-                    # Normal deadline scoring (closer deadline = higher score)
-                    score += self.deadline_weight / (remaining_time + 1.0)
-            else:
-                # No deadline, use a default score
-                score += 0.1
+        Returns:
+            The selected tasks, highest score first
+        """
+        if not ready_tasks or k <= 0:
+            return []
+        
+        top_scores = heapq.nlargest(k, self._score_tasks(ready_tasks), key=itemgetter(1))
+        
+        logger.debug(f"Deadline algorithm selected {len(top_scores)} tasks")
+        return [task for task, _ in top_scores]
+    
+    def add_ready_task(self, task: Task):
+        """
+        Append a task to the ready columns.
+        
+        Args:
+            task: Task that became ready
+        """
+        if task.task_id in self._rows:
+            return
+        row = len(self._task_refs)
+        self._rows[task.task_id] = row
+        self._task_refs.append(task)
+        if NUMPY_AVAILABLE:
+            if row == len(self._deadlines):
+                deadlines = np.empty(2 * row, dtype=np.float64)
+                deadlines[:row] = self._deadlines
+                self._deadlines = deadlines
+                priorities = np.empty(2 * row, dtype=np.int8)
+                priorities[:row] = self._priorities
+                self._priorities = priorities
+                seqs = np.empty(2 * row, dtype=np.int64)
+                seqs[:row] = self._seqs
+                self._seqs = seqs
+                versions = np.empty(2 * row, dtype=np.int64)
+                versions[:row] = self._versions
+                self._versions = versions
+            self._write_row(row, task)
+            self._seqs[row] = next(self._counter)
+        else:
+            self._seqs.append(next(self._counter))
+    
+    def update_ready_task(self, task: Task) -> bool:
+        """
+        Rewrite a queued task's deadline and priority columns in place.
+        
+        Args:
+            task: Task whose scheduling inputs changed
             
-            # Priority component
-            score += self.priority_weight * task.priority.value
+        Returns:
+            True if the task is queued
+        """
+        row = self._rows.get(task.task_id)
+        if row is None:
+            return False
+        if NUMPY_AVAILABLE:
+            self._write_row(row, task)
+        return True
+    
+    def _write_row(self, row: int, task: Task):
+        """Write a task's deadline, priority and version into its columns"""
+        self._deadlines[row] = task._deadline_ts if task._deadline_ts is not None else np.inf
+        self._priorities[row] = task._priority_int
+        self._versions[row] = task._version
+    
+    def _refresh_stale_rows(self, count: int):
+        """Rewrite the columns of tasks changed since they were written"""
+        for row, (task, version) in enumerate(zip(self._task_refs, self._versions[:count].tolist())):
+            if task._version != version:
+                self._write_row(row, task)
+    
+    def remove_ready_task(self, task: Task) -> bool:
+        """
+        Remove a task from the ready columns.
+        
+        Args:
+            task: Task to remove
             
-            task_scores.append((task, score))
+        Returns:
+            True if the task was queued
+        """
+        row = self._rows.pop(task.task_id, None)
+        if row is None:
+            return False
+        self._remove_row(row)
+        return True
+    
+    def _remove_row(self, row: int):
+        """Fill a freed row with the last one"""
+        last_task = self._task_refs.pop()
+        last = len(self._task_refs)
+        if row < last:
+            self._task_refs[row] = last_task
+            self._rows[last_task.task_id] = row
+            self._seqs[row] = self._seqs[last]
+            if NUMPY_AVAILABLE:
+                self._deadlines[row] = self._deadlines[last]
+                self._priorities[row] = self._priorities[last]
+                self._versions[row] = self._versions[last]
+        if not NUMPY_AVAILABLE:
+            self._seqs.pop()
+    
+    def pop_next_task(self) -> Optional[Task]:
+        """
+        Select and remove the highest scoring ready task. Large ready sets
+        are scored by the compiled _deadline_argmax kernel when Numba is
+        installed, or vectorized with NumPy otherwise; either way stale rows
+        are refreshed first, so every path scores the tasks' current inputs.
         
-        # Sort by score (highest first)
-        task_scores.sort(key=lambda x: x[1], reverse=True)
+        Returns:
+            The selected task, or None if no task is ready
+        """
+        count = len(self._task_refs)
+        if count == 0:
+            return None
         
-        selected_task = task_scores[0][0]
+        if NUMPY_AVAILABLE and count >= VECTORIZE_THRESHOLD:
+            self._refresh_stale_rows(count)
+        if NUMBA_AVAILABLE and count >= VECTORIZE_THRESHOLD:
+            row, best_score = _deadline_argmax(self._deadlines, self._priorities, self._seqs, count,
+                                               time.time(), self.deadline_weight,
+                                               self.priority_weight)
+            selected_task = self._task_refs[row]
+            logger.debug(f"Deadline algorithm selected task: {selected_task.name} "
+                        f"(deadline: {selected_task.deadline}, score: {best_score:.2f})")
+        elif NUMPY_AVAILABLE and count >= VECTORIZE_THRESHOLD:
+            remaining = self._deadlines[:count] - time.time()
+            scores = (self.deadline_weight / (np.maximum(remaining, _EPS) + 1.0)
+                      + OVERDUE_BONUS * (remaining <= 0.0))
+            scores[np.isinf(remaining)] = 0.1  # no deadline
+            scores += self.priority_weight * self._priorities[:count]
+            best_rows = np.flatnonzero(scores == scores.max())
+            row = int(best_rows[self._seqs[best_rows].argmin()])
+            selected_task = self._task_refs[row]
+            logger.debug(f"Deadline algorithm selected task: {selected_task.name} "
+                        f"(deadline: {selected_task.deadline}, score: {scores[row]:.2f})")
+        else:
+            task_scores = self._score_tasks(self._task_refs)
+            seqs = self._seqs
+            row = max(range(count), key=lambda r: (task_scores[r][1], -seqs[r]))
+            selected_task, best_score = task_scores[row]
+            logger.debug(f"Deadline algorithm selected task: {selected_task.name} "
+                        f"(deadline: {selected_task.deadline}, score: {best_score:.2f})")
         
-        logger.debug(f"Deadline algorithm selected task: {selected_task.name} "
-                    f"(deadline: {selected_task.deadline}, score: {task_scores[0][1]:.2f})")
+        self._last_popped = (selected_task.task_id, int(self._seqs[row]))
+        del self._rows[selected_task.task_id]
+        self._remove_row(row)
         return selected_task
+    
+    def requeue_task(self, task: Task):
+        """
+        Re-add the last popped task with its original sequence number, so it
+        keeps its FIFO place among equally scored tasks.
+        
+        Args:
+            task: Task returned by the last pop_next_task
+        """
+        last_popped = self._last_popped
+        if last_popped is None or last_popped[0] != task.task_id or task.task_id in self._rows:
+            self.add_ready_task(task)
+            return
+        self._last_popped = None
+        self.add_ready_task(task)
+        self._seqs[self._rows[task.task_id]] = last_popped[1]
+    
+    def ready_count(self) -> int:
+        """
+        Get the number of queued ready tasks.
+        
+        Returns:
+            Number of queued ready tasks
+        """
+        return len(self._task_refs)
 
 
 class HybridAlgorithm(SchedulingAlgorithm):
     """
     Hybrid scheduling algorithm that combines multiple strategies.
     
-    This algorithm uses a combination of priority, deadline, and
-    round-robin scheduling based on task characteristics.
+    This algorithm routes each decision to the priority, deadline, or
+    round-robin algorithm based on the characteristics of the ready tasks.
     """
     
-    def __init__(self):
-        """Initialize hybrid algorithm"""
+    def __init__(self, urgent_window: float = 60.0):
+        """
+        Initialize hybrid algorithm.
+        
+        Args:
+            urgent_window: Deadlines closer than this many seconds hand the
+                decision to the deadline algorithm
+        """
         super().__init__("Hybrid")
         self.priority_algorithm = PriorityAlgorithm()
         self.deadline_algorithm = DeadlineAlgorithm()
         self.round_robin_algorithm = RoundRobinAlgorithm()
-        self.current_phase = "priority"  # priority, deadline, round_robin
-        self.phase_counter = 0
-        self.phase_length = 10  # Number of tasks per phase
+        self.urgent_window = urgent_window
+        self._last_choice = "priority"  # priority, deadline, round_robin
+    
+    @property
+    def current_phase(self) -> str:
+        """Name of the sub-algorithm that made the last decision"""
+        return self._last_choice
+    
+    def _choose_algorithm(self, ready_tasks: List[Task]) -> SchedulingAlgorithm:
+        """
+        Pick the sub-algorithm for the given ready tasks in a single scan.
+        
+        Any deadline inside the urgent window routes to the deadline
+        algorithm; otherwise priorities spread over more than one level
+        route to the priority algorithm, and round-robin is used when they
+        all tie or only differ by one level.
+        """
+        min_priority = max_priority = ready_tasks[0]._priority_int
+        min_deadline = None
+        for task in ready_tasks:
+            priority = task._priority_int
+            if priority < min_priority:
+                min_priority = priority
+            elif priority > max_priority:
+                max_priority = priority
+            deadline_ts = task._deadline_ts
+            if deadline_ts is not None and (min_deadline is None or deadline_ts < min_deadline):
+                min_deadline = deadline_ts
+        
+        if min_deadline is not None and min_deadline - time.time() <= self.urgent_window:
+            self._last_choice = "deadline"
+            return self.deadline_algorithm
+        if max_priority - min_priority > 1:
+            self._last_choice = "priority"
+            return self.priority_algorithm
+        self._last_choice = "round_robin"
+        return self.round_robin_algorithm
     
     def select_next_task(self, ready_tasks: List[Task]) -> Optional[Task]:
         """
@@ -307,34 +1136,26 @@ class HybridAlgorithm(SchedulingAlgorithm):
         if not ready_tasks:
             return None
         
-        # Determine which algorithm to use based on current phase
-        if self.current_phase == "priority":
-            selected_task = self.priority_algorithm.select_next_task(ready_tasks)
-        elif self.current_phase == "deadline":
-            selected_task = self.deadline_algorithm.select_next_task(ready_tasks)
-        else:  # round_robin
-            selected_task = self.round_robin_algorithm.select_next_task(ready_tasks)
-        
-        # Update phase counter and switch phases if needed
-        self.phase_counter += 1
-        if self.phase_counter >= self.phase_length:
-            self.phase_counter = 0
-            self._switch_phase()
+        selected_task = self._choose_algorithm(ready_tasks).select_next_task(ready_tasks)
         
         logger.debug(f"Hybrid algorithm selected task: {selected_task.name} "
-                    f"(phase: {self.current_phase})")
+                    f"(via {self._last_choice})")
         return selected_task
     
-    def _switch_phase(self):
-        """Switch to the next scheduling phase"""
-        if self.current_phase == "priority":
-            self.current_phase = "deadline"
-        elif self.current_phase == "deadline":
-            self.current_phase = "round_robin"
-        else:  # round_robin
-            self.current_phase = "priority"
+    def select_next_tasks(self, ready_tasks: List[Task], k: int = 1) -> List[Task]:
+        """
+        Select up to k tasks with the sub-algorithm chosen for the ready set.
         
-        logger.debug(f"Hybrid algorithm switched to {self.current_phase} phase")
+        Args:
+            ready_tasks: List of tasks that are ready for execution
+            k: Maximum number of tasks to select
+            
+        Returns:
+            The selected tasks in execution order
+        """
+        if not ready_tasks:
+            return []
+        return self._choose_algorithm(ready_tasks).select_next_tasks(ready_tasks, k)
     
     def get_stats(self) -> dict:
         """
@@ -348,6 +1169,115 @@ class HybridAlgorithm(SchedulingAlgorithm):
             "priority_stats": self.priority_algorithm.get_stats(),
             "deadline_stats": self.deadline_algorithm.get_stats(),
             "round_robin_stats": self.round_robin_algorithm.get_stats(),
-            "current_phase": self.current_phase
+            "current_phase": self._last_choice
         })
-        return stats
\ No newline at end of file
+        return stats
+
+
+class SyncScheduler:
+    """
+    Thread-safe front end for a scheduling algorithm's incremental API.
+    
+    Producers may call add_ready_task from any thread: it only puts the task
+    on a SimpleQueue and never waits for the scheduler lock. Consumers
+    (pop_next_task and friends) drain pending adds into the wrapped algorithm
+    under the lock before selecting, so selection always sees every task
+    added before the call.
+    """
+    
+    def __init__(self, algorithm: SchedulingAlgorithm):
+        """
+        Initialize the wrapper.
+        
+        Args:
+            algorithm: Algorithm to drive; only touched under the lock
+        """
+        self.algorithm = algorithm
+        self._add_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+    
+    def add_ready_task(self, task: Task):
+        """
+        Queue a task for the algorithm without taking the lock.
+        
+        Args:
+            task: Task that became ready
+        """
+        self._add_queue.put_nowait(task)
+    
+    def _drain(self):
+        """Move queued tasks into the algorithm; caller holds the lock"""
+        get_task = self._add_queue.get_nowait
+        add_ready_task = self.algorithm.add_ready_task
+        while True:
+            try:
+                task = get_task()
+            except queue.Empty:
+                return
+            add_ready_task(task)
+    
+    def process_ready_tasks(self) -> bool:
+        """
+        Drain queued tasks into the algorithm if the lock is free.
+        
+        Returns:
+            False if another thread holds the lock; it drains the queue
+            itself before selecting, so nothing is lost
+        """
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._drain()
+        finally:
+            self._lock.release()
+        return True
+    
+    def remove_ready_task(self, task: Task) -> bool:
+        """
+        Remove a ready task without selecting it.
+        
+        Args:
+            task: Task to remove
+            
+        Returns:
+            True if the task was ready
+        """
+        with self._lock:
+            self._drain()
+            return self.algorithm.remove_ready_task(task)
+    
+    def pop_next_task(self) -> Optional[Task]:
+        """
+        Select and remove the next task.
+        
+        Returns:
+            The selected task, or None if no task is ready
+        """
+        with self._lock:
+            self._drain()
+            return self.algorithm.pop_next_task()
+    
+    def pop_next_tasks(self, k: int) -> List[Task]:
+        """
+        Select and remove up to k tasks.
+        
+        Args:
+            k: Maximum number of tasks to select
+            
+        Returns:
+            The selected tasks in execution order
+        """
+        with self._lock:
+            self._drain()
+            return self.algorithm.pop_next_tasks(k)
+    
+    def ready_count(self) -> int:
+        """
+        Get the number of ready tasks, including ones still queued.
+        
+        Returns:
+            Number of ready tasks
+        """
+        with self._lock:
+            self._drain()
+            return self.algorithm.ready_count()
\ No newline at end of file
@@ -3,17 +3,23 @@ Task module for Daydreamer Project
 This module defines the Task class and related enums for task scheduling.
 """
 
-import uuid
+import itertools
+import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import List, Optional, Dict, Any, Set
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-class TaskPriority(Enum):
+
+class TaskPriority(IntEnum):
     """Task priority levels"""
     LOW = 1
     NORMAL = 2
@@ -31,9 +37,47 @@ class TaskState(Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
     BLOCKED = "blocked"
+    
+    def __init__(self, value):
+        # One bit per member, so a set of states is an int mask and
+        # membership is a single AND: state.bit & mask
+        self.bit = 1 << len(type(self).__members__)
+
+
+# Task IDs are a random per-process prefix plus a counter: unique across
+# processes and restarts without a CSPRNG read and UUID formatting per task
+_task_id_prefix = os.urandom(6).hex()
+_task_id_counter = itertools.count(1)
+
+
+def _reset_task_ids():
+    """Give a forked child its own task ID prefix"""
+    global _task_id_prefix, _task_id_counter
+    _task_id_prefix = os.urandom(6).hex()
+    _task_id_counter = itertools.count(1)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_task_ids)
+
+
+def _make_task_id() -> str:
+    """Generate a new task ID"""
+    return f"{_task_id_prefix}-{next(_task_id_counter)}"
+
 
+# Field order of Task.to_tuple/from_tuple (and the keys of Task.to_dict)
+SERIALIZED_FIELDS = (
+    'task_id', 'name', 'description', 'priority', 'deadline', 'estimated_duration',
+    'dependencies', 'agent_id', 'resources_required', 'data', 'created_at',
+    'started_at', 'completed_at', 'state', 'retry_count', 'max_retries', 'error_message'
+)
 
-@dataclass
+# Fields serialized as ISO 8601 strings by Task.to_dict
+_DATETIME_FIELDS = ('deadline', 'created_at', 'started_at', 'completed_at')
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Task:
     """
     Represents a task that can be scheduled and executed by the scheduler.
@@ -69,7 +113,7 @@ class Task:
     data: Dict[str, Any] = field(default_factory=dict)
     
     # Auto-generated fields
-    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    task_id: str = field(default_factory=_make_task_id)
     created_at: datetime = field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
@@ -78,25 +122,64 @@ class Task:
     max_retries: int = 3
     error_message: Optional[str] = None
     
+    # deadline as a POSIX timestamp, so hot paths compare plain floats instead
+    # of building timedeltas; kept in sync by __post_init__ and set_deadline
+    _deadline_ts: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    # int(priority), read by the scheduling algorithms' scoring loops in place
+    # of the priority.value descriptor; kept in sync by set_priority
+    _priority_int: int = field(default=0, init=False, repr=False, compare=False)
+    # Bumped whenever a scheduling input (priority, deadline) changes, so
+    # algorithms holding precomputed scores can tell theirs is stale
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate task configuration after initialization"""
         if self.estimated_duration <= 0:
             raise ValueError("Estimated duration must be positive")
         
-        if self.priority not in TaskPriority:
+        if not isinstance(self.priority, TaskPriority):
             raise ValueError(f"Invalid priority: {self.priority}")
+        self._priority_int = int(self.priority)
+        
+        if self.deadline:
+            self._deadline_ts = self.deadline.timestamp()
+            if self._deadline_ts <= time.time():
+                logger.warning(f"Task {self.name} has a deadline in the past")
+    
+    def set_priority(self, priority: TaskPriority):
+        """
+        Change the task's priority.
+        
+        Args:
+            priority: New priority level
+        """
+        self.priority = priority
+        self._priority_int = int(priority)
+        self._version += 1
+    
+    def set_deadline(self, deadline: Optional[datetime]):
+        """
+        Change the task's deadline.
         
-        if self.deadline and self.deadline <= datetime.now():
-            logger.warning(f"Task {self.name} has a deadline in the past")
+        Args:
+            deadline: New deadline, or None to clear it
+        """
+        self.deadline = deadline
+        self._deadline_ts = deadline.timestamp() if deadline else None
+        self._version += 1
     
     def is_ready(self) -> bool:
         """
         Check if the task is ready to be executed.
         
+        The is_* state helpers are kept for callers' convenience; scheduler
+        internals compare ``task.state is TaskState.X`` directly, which skips
+        the method call.
+        
         Returns:
             True if the task is in READY state and all dependencies are met
         """
-        return self.state == TaskState.READY
+        return self.state is TaskState.READY
     
     def is_blocked(self) -> bool:
         """
@@ -105,7 +188,7 @@ class Task:
         Returns:
             True if the task is in BLOCKED state
         """
-        return self.state == TaskState.BLOCKED
+        return self.state is TaskState.BLOCKED
     
     def is_completed(self) -> bool:
         """
@@ -114,7 +197,7 @@ class Task:
         Returns:
             True if the task is in COMPLETED state
         """
-        return self.state == TaskState.COMPLETED
+        return self.state is TaskState.COMPLETED
     
     def is_failed(self) -> bool:
         """
@@ -123,30 +206,43 @@ class Task:
         Returns:
             True if the task is in FAILED state
         """
-        return self.state == TaskState.FAILED
+        return self.state is TaskState.FAILED
     
-    def is_overdue(self) -> bool:
+    def is_overdue(self, now_ts: Optional[float] = None) -> bool:
         """
         Check if the task has passed its deadline.
         
+        Args:
+            now_ts: Current time.time(); callers checking many tasks pass one
+                reading to all of them. Read from the clock if omitted.
+        
         Returns:
             True if the task has a deadline and it has passed
         """
-        if not self.deadline:
+        deadline_ts = self._deadline_ts
+        if deadline_ts is None:
             return False
-        return datetime.now() > self.deadline and not self.is_completed()
+        if now_ts is None:
+            now_ts = time.time()
+        return now_ts > deadline_ts and self.state is not TaskState.COMPLETED
     
-    def get_remaining_time(self) -> Optional[float]:
+    def get_remaining_time(self, now_ts: Optional[float] = None) -> Optional[float]:
         """
         Get the remaining time until deadline.
         
+        Args:
+            now_ts: Current time.time(); read from the clock if omitted
+        
         Returns:
             Remaining time in seconds, or None if no deadline
         """
-        if not self.deadline:
+        deadline_ts = self._deadline_ts
+        if deadline_ts is None:
             return None
+        if now_ts is None:
+            now_ts = time.time()
         
-        remaining = (self.deadline - datetime.now()).total_seconds()
+        remaining = deadline_ts - now_ts
         return max(0, remaining)
     
     def get_execution_time(self) -> Optional[float]:
@@ -162,28 +258,29 @@ class Task:
         return (self.completed_at - self.started_at).total_seconds()
     
     def mark_ready(self):
-        """Mark the task as ready for execution"""
-        if self.state == TaskState.PENDING:
+        """Mark the task as ready for execution (from pending, or blocked once its dependencies are met)"""
+        state = self.state
+        if state is TaskState.PENDING or state is TaskState.BLOCKED:
             self.state = TaskState.READY
             logger.debug(f"Task {self.name} marked as ready")
     
     def mark_running(self):
         """Mark the task as running"""
-        if self.state == TaskState.READY:
+        if self.state is TaskState.READY:
             self.state = TaskState.RUNNING
             self.started_at = datetime.now()
             logger.debug(f"Task {self.name} started running")
     
     def mark_completed(self):
         """Mark the task as completed successfully"""
-        if self.state == TaskState.RUNNING:
+        if self.state is TaskState.RUNNING:
             self.state = TaskState.COMPLETED
             self.completed_at = datetime.now()
             logger.debug(f"Task {self.name} completed successfully")
     
     def mark_failed(self, error_message: str = None):
         """Mark the task as failed"""
-        if self.state == TaskState.RUNNING:
+        if self.state is TaskState.RUNNING:
             self.state = TaskState.FAILED
             self.completed_at = datetime.now()
             self.error_message = error_message
@@ -191,13 +288,15 @@ class Task:
     
     def mark_blocked(self):
         """Mark the task as blocked by dependencies"""
-        if self.state in [TaskState.PENDING, TaskState.READY]:
+        state = self.state
+        if state is TaskState.PENDING or state is TaskState.READY:
             self.state = TaskState.BLOCKED
             logger.debug(f"Task {self.name} blocked by dependencies")
     
     def mark_cancelled(self):
         """Mark the task as cancelled"""
-        if self.state not in [TaskState.COMPLETED, TaskState.FAILED]:
+        state = self.state
+        if state is not TaskState.COMPLETED and state is not TaskState.FAILED:
             self.state = TaskState.CANCELLED
             self.completed_at = datetime.now()
             logger.info(f"Task {self.name} cancelled")
@@ -209,7 +308,7 @@ class Task:
         Returns:
             True if the task has failed and hasn't exceeded max retries
         """
-        return (self.state == TaskState.FAILED and 
+        return (self.state is TaskState.FAILED and 
                 self.retry_count < self.max_retries)
     
     def retry(self):
@@ -229,53 +328,90 @@ class Task:
         Returns:
             Dictionary representation of the task
         """
+        deadline = self.deadline
+        started_at = self.started_at
+        completed_at = self.completed_at
         return {
             'task_id': self.task_id,
             'name': self.name,
             'description': self.description,
-            'priority': self.priority.value,
-            'deadline': self.deadline.isoformat() if self.deadline else None,
+            'priority': self._priority_int,
+            'deadline': deadline.isoformat() if deadline is not None else None,
             'estimated_duration': self.estimated_duration,
             'dependencies': self.dependencies,
             'agent_id': self.agent_id,
             'resources_required': list(self.resources_required),
             'data': self.data,
             'created_at': self.created_at.isoformat(),
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'started_at': started_at.isoformat() if started_at is not None else None,
+            'completed_at': completed_at.isoformat() if completed_at is not None else None,
             'state': self.state.value,
             'retry_count': self.retry_count,
             'max_retries': self.max_retries,
             'error_message': self.error_message
         }
     
+    def to_tuple(self) -> tuple:
+        """
+        Convert the task to a positional tuple of its raw field values.
+        
+        Fields follow SERIALIZED_FIELDS. Nothing is formatted or copied, so
+        this is the cheap path for bulk checkpointing through a codec that
+        handles enums, datetimes and sets itself.
+        
+        Returns:
+            Tuple of field values
+        """
+        return (self.task_id, self.name, self.description, self.priority, self.deadline,
+                self.estimated_duration, self.dependencies, self.agent_id,
+                self.resources_required, self.data, self.created_at, self.started_at,
+                self.completed_at, self.state, self.retry_count, self.max_retries,
+                self.error_message)
+    
+    @classmethod
+    def from_tuple(cls, values: tuple) -> 'Task':
+        """
+        Create a task from a tuple produced by to_tuple.
+        
+        Args:
+            values: Field values in SERIALIZED_FIELDS order
+            
+        Returns:
+            Task instance
+        """
+        return cls(**dict(zip(SERIALIZED_FIELDS, values)))
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
         """
         Create a task from a dictionary representation.
         
         Args:
-            data: Dictionary containing task data
+            data: Dictionary containing task data (not modified)
             
         Returns:
             Task instance
         """
-        # Convert priority back to enum
-        if 'priority' in data:
-            data['priority'] = TaskPriority(data['priority'])
+        data = dict(data)
         
-        # Convert state back to enum
-        if 'state' in data:
-            data['state'] = TaskState(data['state'])
+        # Convert priority and state back to enums
+        priority = data.get('priority')
+        if priority is not None:
+            data['priority'] = TaskPriority(priority)
+        state = data.get('state')
+        if state is not None:
+            data['state'] = TaskState(state)
         
         # Convert datetime strings back to datetime objects
-        for field in ['deadline', 'created_at', 'started_at', 'completed_at']:
-            if field in data and data[field]:
-                data[field] = datetime.fromisoformat(data[field])
+        for name in _DATETIME_FIELDS:
+            value = data.get(name)
+            if value:
+                data[name] = datetime.fromisoformat(value)
         
         # Convert resources_required back to set
-        if 'resources_required' in data:
-            data['resources_required'] = set(data['resources_required'])
+        resources_required = data.get('resources_required')
+        if resources_required is not None:
+            data['resources_required'] = set(resources_required)
         
         return cls(**data)
     
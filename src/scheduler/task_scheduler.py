@@ -4,9 +4,14 @@ This module provides the main TaskScheduler class for managing task execution.
 """
 
 import asyncio
+import contextvars
+import heapq
 import logging
+import sys
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Set, Tuple
+from operator import attrgetter
 import threading
 import time
 
@@ -16,6 +21,17 @@ from .resource_manager import ResourceManager, Resource, ResourceType
 
 logger = logging.getLogger(__name__)
 
+# create_task only accepts an explicit context from 3.11; before that each
+# task copies the caller's context as usual
+_CREATE_TASK_TAKES_CONTEXT = sys.version_info >= (3, 11)
+
+# States a queued (not yet running) task can be cancelled from, as a TaskState.bit mask
+_QUEUED_STATES = TaskState.PENDING.bit | TaskState.READY.bit | TaskState.BLOCKED.bit
+
+# TaskState.bit -> state value. Summaries read the plain bit attribute and a
+# dict instead of Enum.value, whose descriptor runs Python code per access.
+_STATE_VALUES = {state.bit: state.value for state in TaskState}
+
 
 class TaskScheduler:
     """
@@ -29,6 +45,17 @@ class TaskScheduler:
     - Task monitoring and statistics
     """
     
+    # Seconds between retries while ready tasks wait on resources, and the
+    # longest the loop sleeps with nothing to do before checking in anyway
+    RESOURCE_RETRY_INTERVAL = 0.1
+    IDLE_WAKEUP_INTERVAL = 5.0
+    # Seconds between refreshes of the stats snapshot served while running
+    STATS_SNAPSHOT_INTERVAL = 1.0
+    
+    # How many finished tasks are kept in completed_tasks/failed_tasks; older
+    # ones drop off (they stay in self.tasks and in the running statistics)
+    FINISHED_HISTORY_SIZE = 10_000
+    
     def __init__(self, 
                  algorithm: Optional[SchedulingAlgorithm] = None,
                  max_concurrent_tasks: int = 10,
@@ -45,22 +72,69 @@ class TaskScheduler:
         self.max_concurrent_tasks = max_concurrent_tasks
         self.enable_resource_management = enable_resource_management
         
-        # Task storage
+        # Task storage. Ready tasks are ordered by the algorithm's incremental
+        # structure (add_ready_task/pop_next_task); _ready only tracks
+        # membership, in arrival order, for listing and counting.
         self.tasks: Dict[str, Task] = {}
-        self.ready_queue: List[Task] = []
+        self._ready: Dict[str, Task] = {}
         self.running_tasks: Dict[str, Task] = {}
-        self.completed_tasks: List[Task] = []
-        self.failed_tasks: List[Task] = []
+        self.completed_tasks: deque = deque(maxlen=self.FINISHED_HISTORY_SIZE)
+        self.failed_tasks: deque = deque(maxlen=self.FINISHED_HISTORY_SIZE)
+        
+        # Dependency graph: task_id -> IDs of blocked tasks waiting on it, and
+        # blocked task_id -> number of its dependencies not yet completed
+        self._dependents: Dict[str, Set[str]] = {}
+        self._unmet_deps: Dict[str, int] = {}
+        
+        # Deadline tracking: a min-heap of (deadline_ts, task_id) for tasks not
+        # yet past their deadline, and the tasks already found overdue, so
+        # overdue reporting only looks at tasks whose deadline has passed
+        self._deadline_heap: List[Tuple[float, str]] = []
+        self._overdue: Dict[str, Task] = {}
         
-        # Resource management
+        # Resource management. Each task's resources_required is converted to
+        # ResourceType once at submission; the first available resource per
+        # type is cached until the next tick or allocation change.
         self.resource_manager = ResourceManager() if enable_resource_management else None
+        self._resource_types: Dict[str, Tuple[ResourceType, ...]] = {}
+        self._avail_cache: Dict[ResourceType, Optional[Resource]] = {}
+        # Finished tasks whose resources are released together, once per tick
+        self._pending_dealloc: List[str] = []
         
         # Scheduling state
         self.is_running = False
         self.scheduler_task = None
+        self._start_mono: Optional[float] = None
         self.lock = threading.RLock()
+        # Outcomes of finished task coroutines as (task, outcome, error). The
+        # coroutines only append here; the loop applies them in bulk under
+        # the lock it already holds for the tick, so a completion never has
+        # to take the thread lock on the event loop by itself.
+        self._finished: deque = deque()
+        # Set whenever task states change (submit, cancel, finish); while it is
+        # clear and nothing is ready, the loop has no work to look at.
+        # _notify also sets _wake, which the loop sleeps on between ticks;
+        # both the event and its loop only exist while the scheduler runs.
+        self._ready_dirty = True
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Task execution coroutines don't read context variables, so they all
+        # share one empty context rather than copying the loop's per start
+        self._exec_task_kwargs = {"context": contextvars.Context()} if _CREATE_TASK_TAKES_CONTEXT else {}
         
-        # Statistics
+        # Statistics; the average completion time is kept as a running sum so
+        # it does not depend on the bounded completed_tasks history
+        self._completion_time_sum = 0.0
+        self._completion_count = 0
+        # While running, get_stats serves this snapshot without taking the
+        # lock; a background task republishes it every STATS_SNAPSHOT_INTERVAL
+        self._stats_snapshot: Optional[Dict[str, Any]] = None
+        self._stats_task = None
+        
+        # Set (via the resource manager's conflict listeners) when a conflict
+        # is noted; the resolution loop sleeps on it while running
+        self._conflict_event: Optional[asyncio.Event] = None
+        self._conflict_task = None
         self.stats = {
             "total_tasks_submitted": 0,
             "total_tasks_completed": 0,
@@ -71,18 +145,35 @@ class TaskScheduler:
             "start_time": None
         }
         
-        # Event handlers
-        self.event_handlers: Dict[str, List[Callable]] = {
-            "task_started": [],
-            "task_completed": [],
-            "task_failed": [],
-            "task_cancelled": [],
-            "resource_allocated": [],
-            "resource_deallocated": []
+        # Event handlers, stored as tuples that add_event_handler replaces, so
+        # firing an event iterates a fixed snapshot
+        self.event_handlers: Dict[str, Tuple[Callable, ...]] = {
+            "task_started": (),
+            "task_completed": (),
+            "task_failed": (),
+            "task_cancelled": (),
+            "resource_allocated": (),
+            "resource_deallocated": ()
         }
         
         logger.info(f"Task Scheduler initialized with {self.algorithm.name} algorithm")
     
+    @property
+    def ready_queue(self) -> List[Task]:
+        """Snapshot of the ready tasks in arrival order"""
+        return list(self._ready.values())
+    
+    def _push_ready(self, task: Task):
+        """Hand a ready task to the scheduling algorithm; caller holds the lock"""
+        if task.task_id not in self._ready:
+            self._ready[task.task_id] = task
+            self.algorithm.add_ready_task(task)
+    
+    def _remove_ready(self, task: Task):
+        """Withdraw a ready task from the scheduling algorithm; caller holds the lock"""
+        if self._ready.pop(task.task_id, None) is not None:
+            self.algorithm.remove_ready_task(task)
+    
     def submit_task(self, task: Task) -> bool:
         """
         Submit a task to the scheduler.
@@ -95,25 +186,48 @@ class TaskScheduler:
         """
         with self.lock:
             if task.task_id in self.tasks:
-                logger.warning(f"Task {task.task_id} already exists in scheduler")
+                logger.warning("Task %s already exists in scheduler", task.task_id)
                 return False
             
             # Validate task dependencies
             if not self._validate_dependencies(task):
-                logger.warning(f"Task {task.name} has invalid dependencies")
+                logger.warning("Task %s has invalid dependencies", task.name)
                 return False
             
+            # Resource names are only meaningful (and validated) when
+            # resources are being managed
+            resource_types = ()
+            if self.enable_resource_management:
+                try:
+                    resource_types = tuple(ResourceType(r) for r in task.resources_required)
+                except ValueError:
+                    logger.warning("Task %s requires unknown resource types", task.name)
+                    return False
+            
+            self._resource_types[task.task_id] = resource_types
+            if task._deadline_ts is not None:
+                heapq.heappush(self._deadline_heap, (task._deadline_ts, task.task_id))
             self.tasks[task.task_id] = task
             self.stats["total_tasks_submitted"] += 1
+            self._notify()
             
-            # Check if task is ready to run
-            if self._are_dependencies_met(task):
+            # Check if task is ready to run, indexing any unmet dependencies
+            unmet = 0
+            for dep_id in dict.fromkeys(task.dependencies):
+                if self.tasks[dep_id].state is not TaskState.COMPLETED:
+                    unmet += 1
+                    self._dependents.setdefault(dep_id, set()).add(task.task_id)
+            
+            if not unmet:
                 task.mark_ready()
-                self.ready_queue.append(task)
-                logger.info(f"Submitted task: {task.name} (ready to run)")
+                self._push_ready(task)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Submitted task: %s (ready to run)", task.name)
             else:
+                self._unmet_deps[task.task_id] = unmet
                 task.mark_blocked()
-                logger.info(f"Submitted task: {task.name} (blocked by dependencies)")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Submitted task: %s (blocked by dependencies)", task.name)
             
             return True
     
@@ -128,33 +242,39 @@ class TaskScheduler:
             True if task was cancelled successfully
         """
         with self.lock:
-            if task_id not in self.tasks:
-                logger.warning(f"Task {task_id} not found")
+            task = self.tasks.get(task_id)
+            if task is None:
+                logger.warning("Task %s not found", task_id)
                 return False
             
-            task = self.tasks[task_id]
+            self._notify()
             
-            if task.state == TaskState.RUNNING:
+            state = task.state
+            if state is TaskState.RUNNING:
                 # Task is currently running, mark it for cancellation
                 task.mark_cancelled()
                 self.stats["total_tasks_cancelled"] += 1
                 self._trigger_event("task_cancelled", task)
-                logger.info(f"Cancelled running task: {task.name}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Cancelled running task: %s", task.name)
                 return True
             
-            elif task.state in [TaskState.PENDING, TaskState.READY, TaskState.BLOCKED]:
-                # Remove from queues
+            elif state.bit & _QUEUED_STATES:
+                # Remove from queues: ready tasks are withdrawn from the
+                # algorithm in O(1)/O(log n) (lazy deletion), blocked ones
+                # from the dependency index
                 task.mark_cancelled()
-                if task in self.ready_queue:
-                    self.ready_queue.remove(task)
+                self._remove_ready(task)
+                self._forget_dependencies(task)
                 
                 self.stats["total_tasks_cancelled"] += 1
                 self._trigger_event("task_cancelled", task)
-                logger.info(f"Cancelled queued task: {task.name}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Cancelled queued task: %s", task.name)
                 return True
             
             else:
-                logger.warning(f"Cannot cancel task {task_id} in state {task.state}")
+                logger.warning("Cannot cancel task %s in state %s", task_id, task.state)
                 return False
     
     def get_task_status(self, task_id: str) -> Optional[TaskState]:
@@ -180,7 +300,7 @@ class TaskScheduler:
             List of ready tasks
         """
         with self.lock:
-            return self.ready_queue.copy()
+            return list(self._ready.values())
     
     def get_running_tasks(self) -> List[Task]:
         """
@@ -200,7 +320,7 @@ class TaskScheduler:
             List of completed tasks
         """
         with self.lock:
-            return self.completed_tasks.copy()
+            return list(self.completed_tasks)
     
     def get_failed_tasks(self) -> List[Task]:
         """
@@ -210,7 +330,7 @@ class TaskScheduler:
             List of failed tasks
         """
         with self.lock:
-            return self.failed_tasks.copy()
+            return list(self.failed_tasks)
     
     async def start(self):
         """Start the task scheduler"""
@@ -220,15 +340,24 @@ class TaskScheduler:
         
         self.is_running = True
         self.stats["start_time"] = datetime.now()
+        self._start_mono = time.monotonic()
+        self._wake = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
         
         logger.info("Starting task scheduler")
         
         # Start the main scheduling loop
         self.scheduler_task = asyncio.create_task(self._scheduling_loop())
         
+        # Publish statistics for lock-free readers
+        self._stats_snapshot = self._build_stats()
+        self._stats_task = asyncio.create_task(self._stats_snapshot_loop())
+        
         # Start resource conflict resolution loop if enabled
         if self.enable_resource_management:
-            asyncio.create_task(self._resource_conflict_resolution_loop())
+            self._conflict_event = asyncio.Event()
+            self.resource_manager.add_conflict_listener(self._on_resource_conflict)
+            self._conflict_task = asyncio.create_task(self._resource_conflict_resolution_loop())
     
     async def stop(self):
         """Stop the task scheduler"""
@@ -237,6 +366,18 @@ class TaskScheduler:
         
         self.is_running = False
         
+        # Stop the conflict resolution loop
+        if self._conflict_task:
+            self.resource_manager.remove_conflict_listener(self._on_resource_conflict)
+            self._conflict_task.cancel()
+            self._conflict_task = None
+        
+        # Stop publishing snapshots; get_stats computes directly from now on
+        if self._stats_task:
+            self._stats_task.cancel()
+            self._stats_task = None
+        self._stats_snapshot = None
+        
         # Cancel the scheduler task
         if self.scheduler_task:
             self.scheduler_task.cancel()
@@ -245,10 +386,16 @@ class TaskScheduler:
             except asyncio.CancelledError:
                 pass
         
+        self._loop = None
+        
+        # Account for tasks that finished after the last tick
+        with self.lock:
+            self._process_finished_tasks()
+        
         # Update uptime
-        if self.stats["start_time"]:
-            uptime = (datetime.now() - self.stats["start_time"]).total_seconds()
-            self.stats["scheduler_uptime"] = uptime
+        if self._start_mono is not None:
+            self.stats["scheduler_uptime"] = time.monotonic() - self._start_mono
+            self._start_mono = None
         
         logger.info("Task scheduler stopped")
     
@@ -256,44 +403,57 @@ class TaskScheduler:
         """Main scheduling loop"""
         while self.is_running:
             try:
+                # Woken up with nothing changed and nothing waiting: skip
+                # selection entirely
+                if not self._ready_dirty and not self._ready:
+                    await self._wait_for_work()
+                    continue
+                
                 with self.lock:
-                    # Check if we can start more tasks
-                    if (len(self.running_tasks) < self.max_concurrent_tasks and 
-                        self.ready_queue):
+                    self._ready_dirty = False
+                    self._avail_cache.clear()
+                    
+                    # Apply finished tasks first so their resources and
+                    # dependents are available to this tick's selection
+                    self._process_finished_tasks()
+                    
+                    # Start as many ready tasks as there are free slots,
+                    # stopping at the first one whose resources aren't available
+                    scheduling_time = 0.0
+                    scheduled = 0
+                    while (len(self.running_tasks) < self.max_concurrent_tasks and
+                           self._ready):
                         
-                        # Select next task using the scheduling algorithm
-                        start_time = time.time()
-                        next_task = self.algorithm.select_next_task(self.ready_queue)
-                        scheduling_time = time.time() - start_time
+                        # Pop the next task from the algorithm's ready structure
+                        start_time = time.perf_counter()
+                        next_task = self.algorithm.pop_next_task()
+                        scheduling_time += time.perf_counter() - start_time
                         
-                        if next_task:
-                            # Remove from ready queue
-                            self.ready_queue.remove(next_task)
-                            
-                            # Check resource availability
-                            if self._can_allocate_resources(next_task):
-                                # Allocate resources
-                                if self._allocate_resources(next_task):
-                                    # Start the task
-                                    await self._start_task(next_task)
-                                    
-                                    # Update algorithm statistics
-                                    self.algorithm.update_stats(scheduling_time)
-                                else:
-                                    # Resource allocation failed, put back in queue
-                                    self.ready_queue.append(next_task)
-                            else:
-                                # Resources not available, put back in queue
-                                self.ready_queue.append(next_task)
-                
-                # Check for completed tasks
-                await self._check_completed_tasks()
-                
-                # Update dependency status
-                self._update_dependencies()
+                        if not next_task:
+                            break
+                        
+                        # Remove from ready queue
+                        del self._ready[next_task.task_id]
+                        
+                        # Check resource availability and allocate
+                        if not (self._can_allocate_resources(next_task) and
+                                self._allocate_resources(next_task)):
+                            # Resources not available, put back in queue in
+                            # the place it was popped from
+                            self._ready[next_task.task_id] = next_task
+                            self.algorithm.requeue_task(next_task)
+                            break
+                        
+                        # Start the task
+                        await self._start_task(next_task)
+                        scheduled += 1
+                    
+                    # Update algorithm statistics once for the whole batch
+                    if scheduled:
+                        self.algorithm.update_stats(scheduling_time, scheduled)
                 
-                # Sleep briefly to prevent busy waiting
-                await asyncio.sleep(0.1)
+                # Sleep until something changes (or a resource retry is due)
+                await self._wait_for_work()
                 
             except asyncio.CancelledError:
                 break
@@ -301,6 +461,53 @@ class TaskScheduler:
                 logger.error(f"Error in scheduling loop: {e}")
                 await asyncio.sleep(1)
     
+    def _notify(self):
+        """Flag a task state change and wake the scheduling loop; safe from any thread"""
+        self._ready_dirty = True
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._wake.set()
+        else:
+            loop.call_soon_threadsafe(self._wake.set)
+    
+    async def _wait_for_work(self):
+        """
+        Sleep until _notify is called. Ready tasks held back by resources
+        are retried every RESOURCE_RETRY_INTERVAL, since resources can be
+        freed outside the scheduler without a notification.
+        """
+        timeout = self.RESOURCE_RETRY_INTERVAL if self._ready else self.IDLE_WAKEUP_INTERVAL
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+    
+    async def _stats_snapshot_loop(self):
+        """Loop for republishing the statistics snapshot"""
+        while self.is_running:
+            try:
+                await asyncio.sleep(self.STATS_SNAPSHOT_INTERVAL)
+                # Assigning the new dict publishes it atomically
+                self._stats_snapshot = self._build_stats()
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error refreshing scheduler stats: {e}")
+    
+    def _on_resource_conflict(self):
+        """Resource manager conflict listener; may be called from any thread"""
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._conflict_event.set)
+    
     async def _resource_conflict_resolution_loop(self):
         """Loop for resolving resource conflicts"""
         while self.is_running:
@@ -310,7 +517,9 @@ class TaskScheduler:
                     if conflicts_resolved > 0:
                         logger.info(f"Resolved {conflicts_resolved} resource conflicts")
                 
-                await asyncio.sleep(5.0)  # Check every 5 seconds
+                # Sleep until the resource manager notes a conflict
+                await self._conflict_event.wait()
+                self._conflict_event.clear()
                 
             except asyncio.CancelledError:
                 break
@@ -325,10 +534,11 @@ class TaskScheduler:
         
         # Create task execution coroutine
         task_coro = self._execute_task(task)
-        asyncio.create_task(task_coro)
+        self._loop.create_task(task_coro, **self._exec_task_kwargs)
         
         self._trigger_event("task_started", task)
-        logger.info(f"Started task: {task.name}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Started task: %s", task.name)
     
     async def _execute_task(self, task: Task):
         """Execute a task"""
@@ -338,55 +548,85 @@ class TaskScheduler:
             
             # Mark task as completed
             task.mark_completed()
-            
-            # Move to completed list
-            with self.lock:
-                if task.task_id in self.running_tasks:
-                    del self.running_tasks[task.task_id]
-                self.completed_tasks.append(task)
-                
-                # Deallocate resources
-                if self.enable_resource_management:
-                    self.resource_manager.deallocate_resources(task.task_id)
-            
-            self.stats["total_tasks_completed"] += 1
-            self._trigger_event("task_completed", task)
-            
-            logger.info(f"Completed task: {task.name}")
+            self._finished.append((task, TaskState.COMPLETED, None))
             
         except asyncio.CancelledError:
-            # Task was cancelled
-            task.mark_cancelled()
-            with self.lock:
-                if task.task_id in self.running_tasks:
-                    del self.running_tasks[task.task_id]
-            
-            self.stats["total_tasks_cancelled"] += 1
-            self._trigger_event("task_cancelled", task)
-            
-            logger.info(f"Cancelled task: {task.name}")
+            # Task was cancelled; if cancel_task() already did so there is
+            # no outcome of our own to report
+            if task.state is TaskState.RUNNING:
+                task.mark_cancelled()
+                self._finished.append((task, TaskState.CANCELLED, None))
+            else:
+                self._finished.append((task, None, None))
             
         except Exception as e:
             # Task failed
             task.mark_failed(str(e))
-            with self.lock:
-                if task.task_id in self.running_tasks:
-                    del self.running_tasks[task.task_id]
-                self.failed_tasks.append(task)
+            self._finished.append((task, TaskState.FAILED, e))
+        
+        self._notify()
+    
+    def _process_finished_tasks(self):
+        """Move finished tasks out of running and update statistics; caller holds the lock"""
+        finished = self._finished
+        while finished:
+            task, outcome, error = finished.popleft()
+            self.running_tasks.pop(task.task_id, None)
+            
+            if task.state is not outcome:
+                # Cancelled by cancel_task() while running, which already
+                # counted it: the execution result is discarded and the
+                # dependents stay blocked, but its resources are freed
+                if self.enable_resource_management and self._resource_types.get(task.task_id):
+                    self._pending_dealloc.append(task.task_id)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Discarded result of cancelled task: %s", task.name)
+            
+            elif outcome is TaskState.COMPLETED:
+                self.completed_tasks.append(task)
+                execution_time = task.get_execution_time()
+                if execution_time is not None:
+                    self._completion_time_sum += execution_time
+                    self._completion_count += 1
+                self._release_dependents(task)
+                
+                # Deallocate resources (batched below)
+                if self.enable_resource_management and self._resource_types.get(task.task_id):
+                    self._pending_dealloc.append(task.task_id)
                 
-                # Deallocate resources
-                if self.enable_resource_management:
-                    self.resource_manager.deallocate_resources(task.task_id)
+                self.stats["total_tasks_completed"] += 1
+                self._trigger_event("task_completed", task)
+                
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Completed task: %s", task.name)
             
-            self.stats["total_tasks_failed"] += 1
-            self._trigger_event("task_failed", task)
+            elif outcome is TaskState.CANCELLED:
+                # Deallocate resources (batched below)
+                if self.enable_resource_management and self._resource_types.get(task.task_id):
+                    self._pending_dealloc.append(task.task_id)
+                
+                self.stats["total_tasks_cancelled"] += 1
+                self._trigger_event("task_cancelled", task)
+                
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Cancelled task: %s", task.name)
             
-            logger.error(f"Task {task.name} failed: {e}")
-    
-    async def _check_completed_tasks(self):
-        """Check for completed tasks and update statistics"""
-        # This is handled in _execute_task for simplicity
-        pass
+            else:
+                self.failed_tasks.append(task)
+                
+                # Deallocate resources (batched below)
+                if self.enable_resource_management and self._resource_types.get(task.task_id):
+                    self._pending_dealloc.append(task.task_id)
+                
+                self.stats["total_tasks_failed"] += 1
+                self._trigger_event("task_failed", task)
+                
+                logger.error("Task %s failed: %s", task.name, error)
+        
+        if self._pending_dealloc:
+            self.resource_manager.deallocate_many(self._pending_dealloc)
+            self._pending_dealloc.clear()
+            self._avail_cache.clear()
     
     def _validate_dependencies(self, task: Task) -> bool:
         """Validate that all dependencies exist"""
@@ -395,58 +635,73 @@ class TaskScheduler:
                 return False
         return True
     
-    def _are_dependencies_met(self, task: Task) -> bool:
-        """Check if all dependencies are completed"""
-        for dep_id in task.dependencies:
-            if dep_id not in self.tasks:
-                return False
-            dep_task = self.tasks[dep_id]
-            if not dep_task.is_completed():
-                return False
-        return True
+    def _release_dependents(self, task: Task):
+        """
+        Count a completed task off its dependents, moving any whose last
+        dependency it was to the ready queue; caller holds the lock.
+        """
+        unmet_deps = self._unmet_deps
+        for dependent_id in self._dependents.pop(task.task_id, ()):
+            remaining = unmet_deps[dependent_id] - 1
+            if remaining:
+                unmet_deps[dependent_id] = remaining
+                continue
+            del unmet_deps[dependent_id]
+            dependent = self.tasks[dependent_id]
+            if dependent.state is TaskState.BLOCKED:
+                dependent.mark_ready()
+                self._push_ready(dependent)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Task %s dependencies met, moved to ready queue", dependent.name)
+    
+    def _available_resource(self, resource_type: ResourceType) -> Optional[Resource]:
+        """First available resource of a type, via the per-tick cache; caller holds the lock"""
+        cache = self._avail_cache
+        if resource_type not in cache:
+            cache[resource_type] = next(
+                self.resource_manager.get_available_resources(resource_type), None
+            )
+        return cache[resource_type]
     
-    def _update_dependencies(self):
-        """Update dependency status for blocked tasks"""
-        for task in self.tasks.values():
-            if task.state == TaskState.BLOCKED:
-                if self._are_dependencies_met(task):
-                    task.mark_ready()
-                    if task not in self.ready_queue:
-                        self.ready_queue.append(task)
-                    logger.debug(f"Task {task.name} dependencies met, moved to ready queue")
+    def _forget_dependencies(self, task: Task):
+        """Drop a blocked task from the dependency index; caller holds the lock"""
+        if self._unmet_deps.pop(task.task_id, None) is None:
+            return
+        for dep_id in task.dependencies:
+            dependents = self._dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(task.task_id)
     
     def _can_allocate_resources(self, task: Task) -> bool:
         """Check if resources can be allocated for the task"""
-        if not self.enable_resource_management or not task.resources_required:
+        resource_types = self._resource_types.get(task.task_id)
+        if not self.enable_resource_management or not resource_types:
             return True
         
         # Check if required resources are available
-        for resource_type in task.resources_required:
-            available_resources = self.resource_manager.get_available_resources(
-                ResourceType(resource_type)
-            )
-            if not available_resources:
+        for resource_type in resource_types:
+            if self._available_resource(resource_type) is None:
                 return False
         
         return True
     
     def _allocate_resources(self, task: Task) -> bool:
         """Allocate resources for the task"""
-        if not self.enable_resource_management or not task.resources_required:
+        resource_types = self._resource_types.get(task.task_id)
+        if not self.enable_resource_management or not resource_types:
             return True
         
         # Create resource requirements dictionary
         resource_requirements = {}
-        for resource_type in task.resources_required:
-            available_resources = self.resource_manager.get_available_resources(
-                ResourceType(resource_type)
-            )
-            if available_resources:
-                # Allocate from the first available resource
-                resource = available_resources[0]
+        for resource_type in resource_types:
+            # Allocate from the first available resource
+            resource = self._available_resource(resource_type)
+            if resource is not None:
                 resource_requirements[resource.resource_id] = 1.0  # Default amount
         
-        return self.resource_manager.allocate_resources(task.task_id, resource_requirements)
+        allocated = self.resource_manager.allocate_resources(task.task_id, resource_requirements)
+        self._avail_cache.clear()
+        return allocated
     
     def add_event_handler(self, event_type: str, handler: Callable):
         """
@@ -456,39 +711,85 @@ class TaskScheduler:
             event_type: Type of event to handle
             handler: Function to call when event occurs
         """
-        if event_type not in self.event_handlers:
-            self.event_handlers[event_type] = []
-        self.event_handlers[event_type].append(handler)
+        self.event_handlers[event_type] = self.event_handlers.get(event_type, ()) + (handler,)
     
     def _trigger_event(self, event_type: str, task: Task):
         """Trigger an event"""
-        if event_type in self.event_handlers:
-            for handler in self.event_handlers[event_type]:
-                try:
-                    handler(task)
-                except Exception as e:
-                    logger.error(f"Error in event handler for {event_type}: {e}")
+        handlers = self.event_handlers.get(event_type)
+        if not handlers:
+            return
+        for handler in handlers:
+            try:
+                handler(task)
+            except Exception as e:
+                logger.error(f"Error in event handler for {event_type}: {e}")
+    
+    def _collect_overdue(self, now_ts: float) -> List[Task]:
+        """
+        Get the overdue tasks, in deadline order; caller holds the lock.
+        
+        Entries whose deadline has passed move from the deadline heap into
+        the overdue set, which is then filtered with is_overdue. Tasks that
+        completed are dropped; tasks whose deadline was pushed back after
+        submission go back on the heap. (A deadline moved earlier is picked
+        up once the originally submitted one passes.)
+        
+        Args:
+            now_ts: Current time.time()
+            
+        Returns:
+            List of overdue tasks
+        """
+        heap = self._deadline_heap
+        overdue = self._overdue
+        while heap and heap[0][0] < now_ts:
+            _, task_id = heapq.heappop(heap)
+            overdue[task_id] = self.tasks[task_id]
+        
+        result = []
+        for task_id, task in list(overdue.items()):
+            if task.is_overdue(now_ts):
+                result.append(task)
+                continue
+            del overdue[task_id]
+            deadline_ts = task._deadline_ts
+            if deadline_ts is not None and task.state is not TaskState.COMPLETED:
+                heapq.heappush(heap, (deadline_ts, task_id))
+        return result
     
     def get_stats(self) -> Dict[str, Any]:
         """
         Get scheduler statistics.
         
+        While the scheduler is running this returns a copy of the snapshot
+        published every STATS_SNAPSHOT_INTERVAL seconds, without taking the
+        scheduler lock; otherwise the statistics are computed directly.
+        
         Returns:
             Dictionary containing scheduler statistics
         """
+        snapshot = self._stats_snapshot
+        if snapshot is not None:
+            return dict(snapshot)
+        return self._build_stats()
+    
+    def _build_stats(self) -> Dict[str, Any]:
+        """Compute scheduler statistics under the lock"""
         with self.lock:
             stats = self.stats.copy()
             
-            # Calculate average completion time
-            completed_tasks = [t for t in self.completed_tasks if t.get_execution_time() is not None]
-            if completed_tasks:
-                avg_time = sum(t.get_execution_time() for t in completed_tasks) / len(completed_tasks)
-                stats["average_completion_time"] = avg_time
+            # Live uptime while running; stop() records the final value
+            if self._start_mono is not None:
+                stats["scheduler_uptime"] = time.monotonic() - self._start_mono
+            
+            # Average completion time from the running totals
+            if self._completion_count:
+                stats["average_completion_time"] = self._completion_time_sum / self._completion_count
             
             # Add current state information
             stats.update({
                 "total_tasks": len(self.tasks),
-                "ready_tasks": len(self.ready_queue),
+                "ready_tasks": len(self._ready),
                 "running_tasks": len(self.running_tasks),
                 "completed_tasks": len(self.completed_tasks),
                 "failed_tasks": len(self.failed_tasks),
@@ -517,51 +818,57 @@ class TaskScheduler:
                 "recent_tasks": []
             }
             
-            # Group tasks by state
+            # Group tasks by state and by priority in a single pass, keyed by
+            # the cached integers; state keys become values once at the end
+            state_values = _STATE_VALUES
+            tasks_by_state_bit: Dict[int, List[Dict[str, Any]]] = {}
+            tasks_by_priority = summary["tasks_by_priority"]
             for task in self.tasks.values():
-                state = task.state.value
-                if state not in summary["tasks_by_state"]:
-                    summary["tasks_by_state"][state] = []
-                summary["tasks_by_state"][state].append({
+                state_bit = task.state.bit
+                priority = task._priority_int
+                by_state = tasks_by_state_bit.get(state_bit)
+                if by_state is None:
+                    by_state = tasks_by_state_bit[state_bit] = []
+                by_state.append({
                     "task_id": task.task_id,
                     "name": task.name,
-                    "priority": task.priority.value
+                    "priority": priority
                 })
-            
-            # Group tasks by priority
-            for task in self.tasks.values():
-                priority = task.priority.value
-                if priority not in summary["tasks_by_priority"]:
-                    summary["tasks_by_priority"][priority] = []
-                summary["tasks_by_priority"][priority].append({
+                by_priority = tasks_by_priority.get(priority)
+                if by_priority is None:
+                    by_priority = tasks_by_priority[priority] = []
+                by_priority.append({
                     "task_id": task.task_id,
                     "name": task.name,
-                    "state": task.state.value
+                    "state": state_values[state_bit]
                 })
+            summary["tasks_by_state"] = {
+                state_values[state_bit]: by_state
+                for state_bit, by_state in tasks_by_state_bit.items()
+            }
             
             # Find overdue tasks
-            for task in self.tasks.values():
-                if task.is_overdue():
-                    summary["overdue_tasks"].append({
-                        "task_id": task.task_id,
-                        "name": task.name,
-                        "deadline": task.deadline.isoformat() if task.deadline else None,
-                        "priority": task.priority.value
-                    })
+            for task in self._collect_overdue(time.time()):
+                summary["overdue_tasks"].append({
+                    "task_id": task.task_id,
+                    "name": task.name,
+                    "deadline": task.deadline.isoformat() if task.deadline else None,
+                    "priority": task._priority_int
+                })
             
             # Get recent tasks (last 10)
-            recent_tasks = sorted(
+            recent_tasks = heapq.nlargest(
+                10,
                 self.tasks.values(),
-                key=lambda t: t.created_at,
-                reverse=True
-            )[:10]
+                key=attrgetter("created_at")
+            )
             
             summary["recent_tasks"] = [
                 {
                     "task_id": task.task_id,
                     "name": task.name,
-                    "state": task.state.value,
-                    "priority": task.priority.value,
+                    "state": state_values[task.state.bit],
+                    "priority": task._priority_int,
                     "created_at": task.created_at.isoformat()
                 }
                 for task in recent_tasks
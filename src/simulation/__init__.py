@@ -3,6 +3,6 @@ Simulation Package
 Contains multi-agent simulation systems
 """
 
-from .multi_agent_simulation import MultiAgentSimulation, SimulationConfig, demo_multi_agent_simulation
+from .multi_agent_simulation import MultiAgentSimulation, SimulationConfig, SimStats, demo_multi_agent_simulation
 
-__all__ = ["MultiAgentSimulation", "SimulationConfig", "demo_multi_agent_simulation"]
\ No newline at end of file
+__all__ = ["MultiAgentSimulation", "SimulationConfig", "SimStats", "demo_multi_agent_simulation"]
\ No newline at end of file
@@ -5,15 +5,48 @@ This system demonstrates multiple intelligent agents interacting using Gemma 3N.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import random
+import sys
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from dataclasses import asdict, dataclass
 from datetime import datetime
 import json
 
 from ..agents.intelligent_agent import IntelligentAgent, AgentConfig
 
+# Optional fast JSON encoder for exports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older versions fall back to __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Encode obj as 2-space indented JSON, with orjson when installed"""
+    if ORJSON_AVAILABLE:
+        # Datetimes and dataclasses go through default=str like json.dumps
+        # does, rather than orjson's native ISO/dict encodings
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                            | orjson.OPT_PASSTHROUGH_DATETIME
+                            | orjson.OPT_PASSTHROUGH_DATACLASS, default=str)
+    return json.dumps(obj, indent=2, default=str).encode()
+
+# Discussion topics for agent-to-agent communication
+_COMM_TOPICS = (
+    "What is consciousness?",
+    "How do neural networks work?",
+    "What is creativity?",
+    "The nature of intelligence",
+    "The future of AI",
+    "Biological vs artificial intelligence"
+)
+
 @dataclass
 class SimulationConfig:
     """Configuration for multi-agent simulation"""
@@ -24,8 +57,17 @@ class SimulationConfig:
     enable_autonomous_thinking: bool = True
     enable_agent_communication: bool = True
     enable_reasoning_tasks: bool = True
+    max_concurrent_llm_calls: int = 16  # in-flight communicate/reason calls
     log_level: str = "INFO"
 
+@dataclass(**_DATACLASS_SLOTS)
+class SimStats:
+    """Running counters for a simulation, updated on every interaction"""
+    total_thoughts: int = 0
+    total_communications: int = 0
+    total_reasoning_sessions: int = 0
+    agent_interactions: int = 0
+
 class MultiAgentSimulation:
     """
     Multi-agent simulation system for Daydreamer project.
@@ -37,18 +79,45 @@ class MultiAgentSimulation:
     - Demonstrate biological process simulation
     """
     
+    # Collaborative reasoning tasks, worked through in order by every agent
+    REASONING_TASKS = (
+        "How can we improve AI agent communication?",
+        "What are the key components of consciousness?",
+        "How do biological processes differ from computational ones?",
+        "What makes an AI system truly intelligent?",
+        "How can we simulate default mode network processes?",
+        "What are the ethical implications of AI consciousness?"
+    )
+    
     def __init__(self, config: SimulationConfig):
         self.config = config
         self.agents: Dict[str, IntelligentAgent] = {}
+        # agent_id -> bound add_to_working_memory of every other agent; built
+        # when the simulation starts, since the agent set is fixed for a run
+        self._broadcast_targets: Dict[str, List[Callable[[str], None]]] = {}
         self.simulation_task = None
         self.is_running = False
         self.start_time = None
-        self.stats = {
-            "total_thoughts": 0,
-            "total_communications": 0,
-            "total_reasoning_sessions": 0,
-            "agent_interactions": 0
+        # Event loop (monotonic) clock readings for the current run
+        self._start_mono: Optional[float] = None
+        self._deadline: Optional[float] = None
+        self._start_time_iso: Optional[str] = None
+        
+        # Stats fields fixed for the simulation's lifetime
+        self._static_stats = {
+            "simulation_id": config.simulation_id,
+            "duration_seconds": config.duration_seconds
         }
+        self.stats = SimStats()
+        
+        # Reasoning results by (personality, task). The task list is fixed, so
+        # a restarted simulation asks the same questions again; those answers
+        # come from here instead of a fresh generation
+        self._reason_cache: Dict[Tuple[str, str], str] = {}
+        
+        # Caps the model calls the simulation loops have in flight; created
+        # in start_simulation so it belongs to the running event loop
+        self._llm_sem: Optional[asyncio.Semaphore] = None
         
         # Configure logging
         logging.basicConfig(level=getattr(logging, config.log_level))
@@ -99,6 +168,11 @@ class MultiAgentSimulation:
         
         self.is_running = True
         self.start_time = datetime.now()
+        self._start_time_iso = self.start_time.isoformat()
+        loop = asyncio.get_running_loop()
+        self._start_mono = loop.time()
+        self._deadline = self._start_mono + self.config.duration_seconds
+        self._llm_sem = asyncio.Semaphore(self.config.max_concurrent_llm_calls)
         
         logger.info(f" Starting multi-agent simulation: {self.config.simulation_id}")
         
@@ -106,6 +180,12 @@ class MultiAgentSimulation:
         for agent in self.agents.values():
             await agent.start()
         
+        self._broadcast_targets = {
+            agent_id: [other.add_to_working_memory for other in self.agents.values()
+                       if other.config.agent_id != agent_id]
+            for agent_id in self.agents
+        }
+        
         # Start simulation tasks
         tasks = []
         
@@ -118,15 +198,35 @@ class MultiAgentSimulation:
         tasks.append(self._simulation_monitoring_loop())
         
         # Run all tasks concurrently
-        self.simulation_task = asyncio.gather(*tasks)
+        self.simulation_task = asyncio.ensure_future(self._run_loops(tasks))
         
+        # The loops run until cancelled; the duration is enforced here, with
+        # one timeout, rather than by the monitoring loop polling the clock
         try:
-            await self.simulation_task
+            await asyncio.wait_for(self.simulation_task, max(0.0, self._deadline - loop.time()))
+        except asyncio.TimeoutError:
+            logger.info("⏰ Simulation duration reached, stopping...")
         except asyncio.CancelledError:
             logger.info("Simulation was cancelled")
         finally:
             await self.stop_simulation()
     
+    @staticmethod
+    async def _run_loops(loops: List[Any]):
+        """
+        Run the simulation loops as one unit. On 3.11+ a TaskGroup cancels
+        the remaining loops as soon as one fails; older versions gather.
+        
+        Args:
+            loops: Loop coroutines to run
+        """
+        if hasattr(asyncio, "TaskGroup"):
+            async with asyncio.TaskGroup() as group:
+                for loop in loops:
+                    group.create_task(loop)
+        else:
+            await asyncio.gather(*loops)
+    
     async def stop_simulation(self):
         """Stop the simulation and clean up"""
         if not self.is_running:
@@ -156,34 +256,24 @@ class MultiAgentSimulation:
             try:
                 # Select two random agents for communication
                 if len(agent_ids) >= 2:
-                    import random
                     agent1_id, agent2_id = random.sample(agent_ids, 2)
                     
                     agent1 = self.agents[agent1_id]
                     agent2 = self.agents[agent2_id]
                     
-                    # Generate a topic for discussion
-                    topics = [
-                        "What is consciousness?",
-                        "How do neural networks work?",
-                        "What is creativity?",
-                        "The nature of intelligence",
-                        "The future of AI",
-                        "Biological vs artificial intelligence"
-                    ]
-                    
-                    topic = random.choice(topics)
+                    # Pick a topic for discussion
+                    topic = random.choice(_COMM_TOPICS)
                     
                     # Agent 1 initiates conversation
                     message = f"Hello {agent2_id}! I'd like to discuss: {topic}"
-                    response = await agent1.communicate(message, agent2_id)
+                    response = await self._bounded(agent1.communicate(message, agent2_id))
                     
                     # Agent 2 responds
-                    reply = await agent2.communicate(response, agent1_id)
+                    reply = await self._bounded(agent2.communicate(response, agent1_id))
                     
                     # Update stats
-                    self.stats["total_communications"] += 2
-                    self.stats["agent_interactions"] += 1
+                    self.stats.total_communications += 2
+                    self.stats.agent_interactions += 1
                     
                     logger.info(f"💬 {agent1_id} ↔ {agent2_id}: {topic}")
                     logger.debug(f"  {agent1_id}: {message}")
@@ -201,65 +291,108 @@ class MultiAgentSimulation:
     
     async def _reasoning_tasks_loop(self):
         """Loop for collaborative reasoning tasks"""
-        reasoning_tasks = [
-            "How can we improve AI agent communication?",
-            "What are the key components of consciousness?",
-            "How do biological processes differ from computational ones?",
-            "What makes an AI system truly intelligent?",
-            "How can we simulate default mode network processes?",
-            "What are the ethical implications of AI consciousness?"
-        ]
+        reasoning_tasks = self.REASONING_TASKS
+        
+        # Every agent reasons about every task, but each works through the
+        # list at its own pace: a slow generation only delays that agent's
+        # next task instead of holding up a round the others wait on
+        await asyncio.gather(*(
+            self._agent_reasoning_worker(agent_id, agent, reasoning_tasks)
+            for agent_id, agent in self.agents.items()
+        ))
+    
+    async def _agent_reasoning_worker(self, agent_id: str, agent: IntelligentAgent,
+                                      reasoning_tasks: Tuple[str, ...]):
+        """
+        Work through the reasoning tasks for one agent, sharing each result
+        with the other agents.
         
+        Args:
+            agent_id: ID of the agent
+            agent: Agent doing the reasoning
+            reasoning_tasks: Tasks to reason about, in order
+        """
+        broadcast_targets = self._broadcast_targets[agent_id]
         task_index = 0
         
-        while self.is_running:
+        while self.is_running and task_index < len(reasoning_tasks):
             try:
-                if task_index < len(reasoning_tasks):
-                    task = reasoning_tasks[task_index]
-                    
-                    logger.info(f"🤔 Collaborative reasoning task: {task}")
-                    
-                    # Have each agent reason about the task
-                    for agent_id, agent in self.agents.items():
-                        reasoning = await agent.reason(task)
-                        logger.info(f"  {agent_id}: {reasoning[:100]}...")
-                        
-                        # Share reasoning with other agents
-                        for other_agent in self.agents.values():
-                            if other_agent.config.agent_id != agent_id:
-                                other_agent.add_to_working_memory(f"{agent_id}'s reasoning: {reasoning[:50]}...")
-                    
-                    self.stats["total_reasoning_sessions"] += len(self.agents)
-                    task_index += 1
+                task = reasoning_tasks[task_index]
+                
+                logger.info(f"🤔 {agent_id} reasoning task: {task}")
                 
-                # Wait before next reasoning session
+                reasoning = await self._cached_reason(agent, task)
+                logger.info(f"  {agent_id}: {reasoning[:100]}...")
+                
+                # Share reasoning with other agents
+                shared = f"{agent_id}'s reasoning: {reasoning[:50]}..."
+                for push in broadcast_targets:
+                    push(shared)
+                
+                self.stats.total_reasoning_sessions += 1
+                task_index += 1
+                
+                # Wait before this agent's next reasoning session
                 await asyncio.sleep(self.config.interaction_frequency * 2)
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in reasoning loop: {e}")
+                logger.error(f"Error in reasoning loop for agent {agent_id}: {e}")
                 await asyncio.sleep(1)
     
+    async def _bounded(self, coro):
+        """
+        Await a model call while holding a slot of the LLM semaphore, so
+        fan-out never has more than max_concurrent_llm_calls generations in
+        flight (size the Ollama server's OLLAMA_NUM_PARALLEL to match).
+        
+        Args:
+            coro: Awaitable agent call (communicate/reason)
+            
+        Returns:
+            The call's result
+        """
+        async with self._llm_sem:
+            return await coro
+    
+    async def _cached_reason(self, agent: IntelligentAgent, task: str) -> str:
+        """
+        Have an agent reason about a task, reusing the answer an agent with
+        the same personality already gave to it.
+        
+        Args:
+            agent: Agent to reason with
+            task: Reasoning task
+            
+        Returns:
+            The agent's reasoning
+        """
+        key = (agent.config.personality, task)
+        reasoning = self._reason_cache.get(key)
+        if reasoning is None:
+            reasoning = await self._bounded(agent.reason(task))
+            # Don't pin a failed generation for the rest of the run
+            if not reasoning.startswith("Reasoning error:"):
+                self._reason_cache[key] = reasoning
+        return reasoning
+    
     async def _simulation_monitoring_loop(self):
         """Monitor simulation progress and stats"""
+        loop = asyncio.get_running_loop()
         while self.is_running:
             try:
                 # Update total thoughts from all agents
                 total_thoughts = sum(agent.stats["thoughts_generated"] for agent in self.agents.values())
-                self.stats["total_thoughts"] = total_thoughts
+                self.stats.total_thoughts = total_thoughts
                 
-                # Log simulation status
-                elapsed = (datetime.now() - self.start_time).total_seconds()
-                remaining = max(0, self.config.duration_seconds - elapsed)
+                # Log simulation status (start_simulation ends the run at the deadline)
+                now = loop.time()
+                elapsed = now - self._start_mono
+                remaining = max(0, self._deadline - now)
                 
                 logger.info(f" Simulation Status - Elapsed: {elapsed:.1f}s, Remaining: {remaining:.1f}s")
-                logger.info(f"  Thoughts: {self.stats['total_thoughts']}, Communications: {self.stats['total_communications']}")
-                
-                # Check if simulation should end
-                if elapsed >= self.config.duration_seconds:
-                    logger.info("⏰ Simulation duration reached, stopping...")
-                    break
+                logger.info(f"  Thoughts: {self.stats.total_thoughts}, Communications: {self.stats.total_communications}")
                 
                 await asyncio.sleep(5)  # Update every 5 seconds
                 
@@ -271,20 +404,19 @@ class MultiAgentSimulation:
     
     def get_simulation_stats(self) -> Dict[str, Any]:
         """Get comprehensive simulation statistics"""
-        agent_stats = {}
-        for agent_id, agent in self.agents.items():
-            agent_stats[agent_id] = agent.get_stats()
+        agent_stats = {agent_id: agent.get_stats() for agent_id, agent in self.agents.items()}
         
-        return {
-            "simulation_id": self.config.simulation_id,
-            "duration_seconds": self.config.duration_seconds,
+        start_time = self.start_time
+        stats = dict(self._static_stats)
+        stats.update({
             "agent_count": len(self.agents),
             "is_running": self.is_running,
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "elapsed_time": (datetime.now() - self.start_time).total_seconds() if self.start_time else 0,
-            "simulation_stats": self.stats,
+            "start_time": self._start_time_iso,
+            "elapsed_time": (datetime.now() - start_time).total_seconds() if start_time else 0,
+            "simulation_stats": asdict(self.stats),
             "agent_stats": agent_stats
-        }
+        })
+        return stats
     
     def export_simulation_data(self, filename: str = None):
         """Export simulation data to JSON file"""
@@ -292,28 +424,39 @@ class MultiAgentSimulation:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"simulation_{self.config.simulation_id}_{timestamp}.json"
         
-        data = {
-            "simulation_config": {
-                "simulation_id": self.config.simulation_id,
-                "duration_seconds": self.config.duration_seconds,
-                "agent_count": self.config.agent_count,
-                "interaction_frequency": self.config.interaction_frequency
-            },
-            "simulation_stats": self.get_simulation_stats(),
-            "agent_memories": {}
+        simulation_config = {
+            "simulation_id": self.config.simulation_id,
+            "duration_seconds": self.config.duration_seconds,
+            "agent_count": self.config.agent_count,
+            "interaction_frequency": self.config.interaction_frequency
         }
         
-        # Export agent memories
-        for agent_id, agent in self.agents.items():
-            data["agent_memories"][agent_id] = {
-                "episodic": agent.memory.episodic,
-                "semantic": agent.memory.semantic,
-                "working": agent.memory.working,
-                "conversation_history": agent.memory.conversation_history
-            }
-        
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        # Write the document piece by piece, one agent's memories at a time,
+        # rather than building and encoding it as one dict. Each piece is
+        # re-indented to its depth so the file reads like an indent=2 dump.
+        with open(filename, 'wb') as f:
+            f.write(b'{\n  "simulation_config": ')
+            f.write(_dump_json(simulation_config).replace(b"\n", b"\n  "))
+            f.write(b',\n  "simulation_stats": ')
+            f.write(_dump_json(self.get_simulation_stats()).replace(b"\n", b"\n  "))
+            f.write(b',\n  "agent_memories": {')
+            
+            # Export agent memories
+            separator = b"\n    "
+            for agent_id, agent in self.agents.items():
+                memories = {
+                    "episodic": agent.memory.episodic,
+                    "semantic": agent.memory.semantic,
+                    "working": agent.memory.working,
+                    "conversation_history": agent.memory.conversation_history
+                }
+                f.write(separator)
+                f.write(_dump_json(agent_id))
+                f.write(b": ")
+                f.write(_dump_json(memories).replace(b"\n", b"\n    "))
+                separator = b",\n    "
+            
+            f.write(b"\n  }\n}" if self.agents else b"}\n}")
         
         logger.info(f"💾 Exported simulation data to: {filename}")
 
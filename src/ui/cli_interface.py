@@ -5,21 +5,100 @@ This module provides a command-line interface for controlling Daydreamer simulat
 managing agents, viewing logs, and configuring the system.
 """
 
+import argparse
+import ast
 import asyncio
+import atexit
+import bisect
 import cmd
 import json
 import logging
+import math
 import readline
 import shlex
-from typing import Dict, List, Optional, Any, Callable
-from datetime import datetime
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future
+from itertools import islice
+from typing import Dict, List, Optional, Any, Callable, Tuple
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
 from ..simulation.multi_agent_simulation import MultiAgentSimulation, SimulationConfig
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def _dump_config(config: Dict[str, Any]) -> bytes:
+    """Encode a configuration as sorted, 2-space indented JSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(config, indent=2, sort_keys=True).encode()
+
+def _load_json(data: bytes) -> Any:
+    """Decode JSON bytes, with orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _is_config_value(value: Any) -> bool:
+    """Check that a value is one the JSON config file can store and read back as-is"""
+    if isinstance(value, float):
+        # inf and nan would be written as null (orjson) or invalid JSON
+        return math.isfinite(value)
+    if isinstance(value, (bool, int, str)):
+        return True
+    if isinstance(value, list):
+        return all(_is_config_value(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_config_value(item)
+                   for key, item in value.items())
+    return False
+
+# Output templates for the status and agent commands
+_STATUS_TEMPLATE = (
+    " Simulation Status:\n"
+    "   ID: {simulation_id}\n"
+    "   Running: {running}\n"
+    "   Agents: {agent_count}\n"
+    "   Total Thoughts: {total_thoughts}\n"
+    "   Total Communications: {total_communications}\n"
+    "   Reasoning Sessions: {total_reasoning_sessions}\n"
+    "   Agent Interactions: {agent_interactions}"
+)
+
+_AGENT_TEMPLATE = (
+    " Agent: {agent_id}\n"
+    "   Personality: {personality}\n"
+    "   Thinking Frequency: {thinking_frequency}s\n"
+    "   Status: {status}\n"
+    "   Thoughts Generated: {thought_count}\n"
+    "   Communications: {communication_count}"
+)
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """Argument parser that reports bad input as ValueError instead of exiting"""
+    
+    def error(self, message):
+        raise ValueError(message)
+
+# Option parsers for commands that take flags, built once at import
+_START_PARSER = _ArgumentParser(prog="start", add_help=False)
+_START_PARSER.add_argument("--id")
+_START_PARSER.add_argument("--duration", type=int)
+_START_PARSER.add_argument("--agents", type=int)
+
+_LOGS_PARSER = _ArgumentParser(prog="logs", add_help=False)
+_LOGS_PARSER.add_argument("--lines", type=int, default=50)
+_LOGS_PARSER.add_argument("--level", type=str.upper)
+
 @dataclass
 class CLICommand:
     """CLI command definition"""
@@ -34,11 +113,19 @@ class CommandRegistry:
     
     def __init__(self):
         self.commands: Dict[str, CLICommand] = {}
+        self._sorted_names: List[str] = []
+        # Rendered help text, rebuilt lazily after a registration changes it
+        self._help_cache: Optional[str] = None
+        self._usage_cache: Dict[str, str] = {}
         self._register_default_commands()
     
     def register(self, command: CLICommand):
         """Register a new command"""
+        if command.name not in self.commands:
+            bisect.insort(self._sorted_names, command.name)
         self.commands[command.name] = command
+        self._help_cache = None
+        self._usage_cache.pop(command.name, None)
     
     def get_command(self, name: str) -> Optional[CLICommand]:
         """Get a command by name"""
@@ -48,6 +135,28 @@ class CommandRegistry:
         """List all available commands"""
         return list(self.commands.keys())
     
+    def rendered_help(self) -> str:
+        """Get the one-line-per-command listing, sorted by name"""
+        if self._help_cache is None:
+            self._help_cache = "\n".join(
+                f"   {name:<15} - {self.commands[name].description}"
+                for name in self._sorted_names
+            )
+        return self._help_cache
+    
+    def rendered_usage(self, name: str) -> Optional[str]:
+        """Get the detailed help block for a command, or None if unknown"""
+        text = self._usage_cache.get(name)
+        if text is None:
+            command = self.commands.get(name)
+            if command is None:
+                return None
+            text = (f"📖 Help for '{name}':\n"
+                    f"   Description: {command.description}\n"
+                    f"   Usage: {command.usage}")
+            self._usage_cache[name] = text
+        return text
+    
     def _register_default_commands(self):
         """Register default CLI commands"""
         # Note: Command handlers will be set after CLIInterface is created
@@ -56,18 +165,36 @@ class CommandRegistry:
 class ConfigurationManager:
     """Manages CLI configuration"""
     
+    DEFAULT_CONFIG = {
+        "default_simulation_id": "cli-simulation",
+        "default_duration": 300,
+        "default_agent_count": 3,
+        "default_interaction_frequency": 10.0,
+        "log_level": "INFO",
+        "log_file": "daydreamer_cli.log",
+        "history_file": ".daydreamer_history",
+        "max_history_length": 1000
+    }
+    
     def __init__(self):
-        self.config = {
-            "default_simulation_id": "cli-simulation",
-            "default_duration": 300,
-            "default_agent_count": 3,
-            "default_interaction_frequency": 10.0,
-            "log_level": "INFO",
-            "log_file": "daydreamer_cli.log",
-            "history_file": ".daydreamer_history"
-        }
         self.config_file = Path("daydreamer_cli_config.json")
-        self._load_config()
+        # Loaded from disk on first access rather than at construction
+        self._config: Optional[Dict[str, Any]] = None
+        # Last content written to config_file and its mtime, to skip no-op saves
+        self._saved_data: Optional[bytes] = None
+        self._saved_mtime: Optional[int] = None
+        # Unsaved changes are written by flush(), at the latest on interpreter exit
+        self._dirty = False
+        self._batch_depth = 0
+        self._flush_registered = False
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration dictionary, loaded from file on first access"""
+        if self._config is None:
+            self._config = dict(self.DEFAULT_CONFIG)
+            self._load_config()
+        return self._config
     
     def get(self, key: str, default=None):
         """Get configuration value"""
@@ -75,57 +202,121 @@ class ConfigurationManager:
     
     def set(self, key: str, value):
         """Set configuration value"""
-        self.config[key] = value
-        self._save_config()
+        config = self.config
+        if key in config and config[key] == value:
+            return
+        config[key] = value
+        self._dirty = True
+        if not self._flush_registered:
+            atexit.register(self.flush)
+            self._flush_registered = True
+    
+    def flush(self, force: bool = False) -> bool:
+        """Write pending configuration changes to file
+        
+        Args:
+            force: Write even when nothing has changed since the last flush
+            
+        Returns:
+            False if writing the file failed, True otherwise
+        """
+        if self._batch_depth or not (self._dirty or force):
+            return True
+        self._dirty = False
+        return self._save_config()
+    
+    @contextmanager
+    def batch(self):
+        """Group several set() calls into a single write when the block exits"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self.flush()
     
     def _load_config(self):
         """Load configuration from file"""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    self.config.update(loaded_config)
+                loaded_config = _load_json(self.config_file.read_bytes())
+                self._config.update(loaded_config)
             except Exception as e:
                 logger.warning(f"Failed to load config: {e}")
     
-    def _save_config(self):
+    def _save_config(self) -> bool:
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            data = _dump_config(self.config)
+            if (data == self._saved_data and self.config_file.exists()
+                    and self.config_file.stat().st_mtime_ns == self._saved_mtime):
+                return True
+            self.config_file.write_bytes(data)
+            self._saved_data = data
+            self._saved_mtime = self.config_file.stat().st_mtime_ns
+            return True
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
+            self._dirty = True
+            return False
 
 class LogViewer:
     """Manages log viewing and filtering"""
     
     def __init__(self, config_manager: ConfigurationManager):
         self.config_manager = config_manager
-        self.log_buffer: List[str] = []
         self.max_buffer_size = 1000
+        # Fixed-size ring of (epoch_second, level, message) entries; the
+        # oldest drops off as a new one is added. Text is built in get_logs.
+        self.log_buffer: deque = deque(maxlen=self.max_buffer_size)
+        # Timestamp text is only re-rendered when the second changes
+        self._last_ts_second = -1
+        self._last_ts_str = ""
+        # Sequence numbers of entries per level; the oldest buffered entry
+        # has sequence number _next_seq - len(log_buffer)
+        self._next_seq = 0
+        self._by_level: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=self.max_buffer_size)
+        )
     
     def add_log(self, message: str, level: str = "INFO"):
         """Add a log message to the buffer"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {level}: {message}"
-        self.log_buffer.append(log_entry)
-        
-        # Keep buffer size manageable
-        if len(self.log_buffer) > self.max_buffer_size:
-            self.log_buffer = self.log_buffer[-self.max_buffer_size:]
+        self.log_buffer.append((int(time.time()), level, message))
+        self._by_level[level].append(self._next_seq)
+        self._next_seq += 1
+    
+    def _format_entry(self, entry: Tuple[int, str, str]) -> str:
+        """Render a buffered entry as '[timestamp] LEVEL: message'"""
+        second, level, message = entry
+        if second != self._last_ts_second:
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            self._last_ts_second = second
+        return f"[{self._last_ts_str}] {level}: {message}"
     
     def get_logs(self, lines: int = 50, level: str = None) -> List[str]:
         """Get recent logs with optional filtering"""
-        logs = self.log_buffer[-lines:] if lines > 0 else self.log_buffer
-        
         if level:
-            logs = [log for log in logs if f" {level}:" in log]
-        
-        return logs
+            seqs = self._by_level.get(level)
+            if not seqs:
+                return []
+            # Drop sequence numbers whose entries were evicted from the ring
+            base = self._next_seq - len(self.log_buffer)
+            while seqs and seqs[0] < base:
+                seqs.popleft()
+            if lines > 0:
+                seqs = islice(seqs, max(0, len(seqs) - lines), None)
+            buffer = self.log_buffer
+            return [self._format_entry(buffer[seq - base]) for seq in seqs]
+        
+        entries = self.log_buffer
+        if lines > 0:
+            entries = islice(entries, max(0, len(entries) - lines), None)
+        return [self._format_entry(entry) for entry in entries]
     
     def clear_logs(self):
         """Clear log buffer"""
         self.log_buffer.clear()
+        self._by_level.clear()
 
 class CLIInterface(cmd.Cmd):
     """
@@ -146,22 +337,31 @@ Type 'help' for available commands or 'exit' to quit.
 """
     prompt = "daydreamer> "
     
+    # Seconds to wait for the simulation to stop and the loop thread to exit
+    SHUTDOWN_TIMEOUT = 5.0
+    
     def __init__(self):
         super().__init__()
         self.simulation: Optional[MultiAgentSimulation] = None
+        # Event loop that runs simulations between prompts, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
         self.command_registry = CommandRegistry()
         self.config_manager = ConfigurationManager()
         self.log_viewer = LogViewer(self.config_manager)
         
         # Register commands
         self._register_commands()
-        
-        # Setup command history
-        self._setup_history()
-        
+    
+    def preloop(self):
+        """Set up logging and history once the interactive loop starts"""
         # Setup logging
         self._setup_logging()
         
+        # Setup command history (skipped for piped or scripted input)
+        if self.stdin.isatty():
+            self._setup_history()
+        
         logger.info("🎛️ CLI Interface initialized")
     
     def _register_commands(self):
@@ -283,6 +483,17 @@ Type 'help' for available commands or 'exit' to quit.
                 readline.read_history_file(str(history_file))
             except Exception as e:
                 logger.warning(f"Failed to load history: {e}")
+        
+        # Bound the file and write it back once, however the session ends
+        readline.set_history_length(self.config_manager.get("max_history_length", 1000))
+        atexit.register(self._save_history, history_file)
+    
+    def _save_history(self, history_file: Path):
+        """Write command history to file"""
+        try:
+            readline.write_history_file(str(history_file))
+        except Exception as e:
+            logger.warning(f"Failed to save history: {e}")
     
     def _setup_logging(self):
         """Setup logging configuration"""
@@ -293,11 +504,45 @@ Type 'help' for available commands or 'exit' to quit.
             level=log_level,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(log_file),
+                logging.FileHandler(log_file, delay=True),
                 logging.StreamHandler()
             ]
         )
     
+    def _run_coroutine(self, coro) -> Future:
+        """Schedule a coroutine on the background event loop
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            Future holding the coroutine's result
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="daydreamer-cli-loop", daemon=True
+            )
+            self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    def _shutdown_loop(self):
+        """Stop the background event loop and wait for its thread"""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(self.SHUTDOWN_TIMEOUT)
+        if not self._loop_thread.is_alive():
+            self._loop.close()
+        self._loop = None
+        self._loop_thread = None
+    
+    def _on_simulation_done(self, future: Future):
+        """Report a simulation that ended with an error"""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Simulation failed: {future.exception()}")
+            self.log_viewer.add_log(f"Simulation failed: {future.exception()}", "ERROR")
+    
     def do_start(self, arg):
         """Start a new simulation"""
         return self._execute_command("start", arg)
@@ -367,16 +612,20 @@ Type 'help' for available commands or 'exit' to quit.
             return False
         
         try:
-            # Parse arguments
-            args = shlex.split(arg) if arg.strip() else []
+            # Parse arguments; only quoted or escaped input needs shlex
+            if '"' in arg or "'" in arg or '\\' in arg:
+                args = shlex.split(arg)
+            else:
+                args = arg.split()
             
-            # Execute command
-            result = command.handler(self, args)
+            # Execute command (handlers are bound methods)
+            result = command.handler(args)
             
             # Log command execution
             self.log_viewer.add_log(f"Executed command: {command_name} {' '.join(args)}")
             
-            return result
+            # cmd.Cmd ends the loop on a true return, so only exit passes its result on
+            return result if command.handler == self._cmd_exit else False
             
         except Exception as e:
             print(f" Error executing {command_name}: {e}")
@@ -389,21 +638,15 @@ Type 'help' for available commands or 'exit' to quit.
             print(" Simulation already running. Use 'stop' first.")
             return False
         
-        # Parse arguments
-        simulation_id = self.config_manager.get("default_simulation_id")
-        duration = self.config_manager.get("default_duration")
-        agent_count = self.config_manager.get("default_agent_count")
+        # Parse arguments, falling back to configured defaults
+        options, _ = _START_PARSER.parse_known_args(args)
+        simulation_id = options.id or self.config_manager.get("default_simulation_id")
+        duration = (options.duration if options.duration is not None
+                    else self.config_manager.get("default_duration"))
+        agent_count = (options.agents if options.agents is not None
+                       else self.config_manager.get("default_agent_count"))
         interaction_frequency = self.config_manager.get("default_interaction_frequency")
         
-        # Override with command line arguments
-        for i, arg in enumerate(args):
-            if arg == "--id" and i + 1 < len(args):
-                simulation_id = args[i + 1]
-            elif arg == "--duration" and i + 1 < len(args):
-                duration = int(args[i + 1])
-            elif arg == "--agents" and i + 1 < len(args):
-                agent_count = int(args[i + 1])
-        
         # Create simulation config
         config = SimulationConfig(
             simulation_id=simulation_id,
@@ -420,7 +663,8 @@ Type 'help' for available commands or 'exit' to quit.
         self.simulation.create_agents()
         
         # Start simulation in background
-        asyncio.create_task(self.simulation.start_simulation())
+        future = self._run_coroutine(self.simulation.start_simulation())
+        future.add_done_callback(self._on_simulation_done)
         
         print(f" Started simulation: {simulation_id}")
         print(f"   Duration: {duration} seconds")
@@ -435,7 +679,7 @@ Type 'help' for available commands or 'exit' to quit.
             print(" No simulation running")
             return False
         
-        asyncio.create_task(self.simulation.stop_simulation())
+        self._run_coroutine(self.simulation.stop_simulation())
         print(" Stopping simulation...")
         return True
     
@@ -447,14 +691,15 @@ Type 'help' for available commands or 'exit' to quit.
         
         stats = self.simulation.get_simulation_stats()
         
-        print(" Simulation Status:")
-        print(f"   ID: {self.simulation.config.simulation_id}")
-        print(f"   Running: {' Yes' if self.simulation.is_running else ' No'}")
-        print(f"   Agents: {len(self.simulation.agents)}")
-        print(f"   Total Thoughts: {stats.get('total_thoughts', 0)}")
-        print(f"   Total Communications: {stats.get('total_communications', 0)}")
-        print(f"   Reasoning Sessions: {stats.get('total_reasoning_sessions', 0)}")
-        print(f"   Agent Interactions: {stats.get('agent_interactions', 0)}")
+        print(_STATUS_TEMPLATE.format(
+            simulation_id=self.simulation.config.simulation_id,
+            running=' Yes' if self.simulation.is_running else ' No',
+            agent_count=len(self.simulation.agents),
+            total_thoughts=stats.get('total_thoughts', 0),
+            total_communications=stats.get('total_communications', 0),
+            total_reasoning_sessions=stats.get('total_reasoning_sessions', 0),
+            agent_interactions=stats.get('agent_interactions', 0)
+        ))
         
         return True
     
@@ -488,12 +733,14 @@ Type 'help' for available commands or 'exit' to quit.
         
         agent = self.simulation.agents[agent_id]
         
-        print(f" Agent: {agent_id}")
-        print(f"   Personality: {agent.config.personality}")
-        print(f"   Thinking Frequency: {agent.config.thinking_frequency}s")
-        print(f"   Status: {'🟢 Active' if agent.is_running else ' Inactive'}")
-        print(f"   Thoughts Generated: {getattr(agent, 'thought_count', 0)}")
-        print(f"   Communications: {getattr(agent, 'communication_count', 0)}")
+        print(_AGENT_TEMPLATE.format(
+            agent_id=agent_id,
+            personality=agent.config.personality,
+            thinking_frequency=agent.config.thinking_frequency,
+            status='🟢 Active' if agent.is_running else ' Inactive',
+            thought_count=getattr(agent, 'thought_count', 0),
+            communication_count=getattr(agent, 'communication_count', 0)
+        ))
         
         return True
     
@@ -517,12 +764,17 @@ Type 'help' for available commands or 'exit' to quit.
             key, value = args
             try:
                 # Try to convert value to appropriate type
-                if value.lower() in ('true', 'false'):
-                    value = value.lower() == 'true'
-                elif value.isdigit():
-                    value = int(value)
-                elif value.replace('.', '').isdigit():
-                    value = float(value)
+                try:
+                    coerced = ast.literal_eval(value)
+                except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                    coerced = None
+                
+                # Literals JSON can't hold (complex, sets, bytes, None,
+                # non-string keys, non-finite floats...) are kept as the raw string
+                if coerced is not None and _is_config_value(coerced):
+                    value = coerced
+                else:
+                    value = {'true': True, 'false': False}.get(value.lower(), value)
                 
                 self.config_manager.set(key, value)
                 print(f" Set {key} = {value}")
@@ -533,11 +785,17 @@ Type 'help' for available commands or 'exit' to quit.
     
     def _cmd_save_config(self, args: List[str]):
         """Save current configuration to file"""
-        filename = args[0] if args else "daydreamer_cli_config.json"
+        if not args:
+            if self.config_manager.flush(force=True):
+                print(f" Configuration saved to {self.config_manager.config_file}")
+            else:
+                print(" Failed to save configuration")
+            return True
+        
+        filename = args[0]
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.config_manager.config, f, indent=2)
+            Path(filename).write_bytes(_dump_config(self.config_manager.config))
             print(f" Configuration saved to {filename}")
         except Exception as e:
             print(f" Failed to save configuration: {e}")
@@ -549,9 +807,8 @@ Type 'help' for available commands or 'exit' to quit.
         filename = args[0] if args else "daydreamer_cli_config.json"
         
         try:
-            with open(filename, 'r') as f:
-                config = json.load(f)
-                self.config_manager.config.update(config)
+            config = _load_json(Path(filename).read_bytes())
+            self.config_manager.config.update(config)
             print(f" Configuration loaded from {filename}")
         except Exception as e:
             print(f" Failed to load configuration: {e}")
@@ -560,17 +817,9 @@ Type 'help' for available commands or 'exit' to quit.
     
     def _cmd_logs(self, args: List[str]):
         """Show recent logs"""
-        lines = 50
-        level = None
-        
-        # Parse arguments
-        for i, arg in enumerate(args):
-            if arg == "--lines" and i + 1 < len(args):
-                lines = int(args[i + 1])
-            elif arg == "--level" and i + 1 < len(args):
-                level = args[i + 1].upper()
+        options, _ = _LOGS_PARSER.parse_known_args(args)
         
-        logs = self.log_viewer.get_logs(lines, level)
+        logs = self.log_viewer.get_logs(options.lines, options.level)
         
         if not logs:
             print("📝 No logs to display")
@@ -594,22 +843,16 @@ Type 'help' for available commands or 'exit' to quit.
             print(" Daydreamer CLI - Available Commands:")
             print()
             
-            commands = self.command_registry.list_commands()
-            for cmd_name in sorted(commands):
-                cmd = self.command_registry.get_command(cmd_name)
-                print(f"   {cmd_name:<15} - {cmd.description}")
-            
+            print(self.command_registry.rendered_help())
             print()
             print("Type 'help COMMAND' for detailed usage information.")
         else:
             # Show specific command help
             cmd_name = args[0]
-            cmd = self.command_registry.get_command(cmd_name)
+            usage = self.command_registry.rendered_usage(cmd_name)
             
-            if cmd:
-                print(f"📖 Help for '{cmd_name}':")
-                print(f"   Description: {cmd.description}")
-                print(f"   Usage: {cmd.usage}")
+            if usage is not None:
+                print(usage)
             else:
                 print(f" Unknown command: {cmd_name}")
         
@@ -619,14 +862,13 @@ Type 'help' for available commands or 'exit' to quit.
         """Exit the CLI"""
         if self.simulation and self.simulation.is_running:
             print(" Stopping simulation before exit...")
-            asyncio.create_task(self.simulation.stop_simulation())
+            try:
+                self._run_coroutine(self.simulation.stop_simulation()).result(self.SHUTDOWN_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"Failed to stop simulation cleanly: {e}")
+        self._shutdown_loop()
         
-        # Save command history
-        history_file = Path(self.config_manager.get("history_file"))
-        try:
-            readline.write_history_file(str(history_file))
-        except Exception as e:
-            logger.warning(f"Failed to save history: {e}")
+        self.config_manager.flush()
         
         print("👋 Goodbye!")
         return True
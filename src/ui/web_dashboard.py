@@ -8,20 +8,39 @@ with real-time updates, agent activity visualization, and interactive controls.
 import asyncio
 import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 import uvicorn
 
 from ..simulation.multi_agent_simulation import MultiAgentSimulation, SimulationConfig
 
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def _json_default(obj: Any) -> Any:
+    """Encode values the json module does not handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dump_json(obj: Any) -> bytes:
+    """Encode obj as compact JSON, with orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=_json_default).encode()
+
 @dataclass
 class DashboardConfig:
     """Configuration for the web dashboard"""
@@ -60,12 +79,21 @@ class WebDashboard:
     - Responsive design for multiple screen sizes
     """
     
+    # Seconds between real-time updates pushed to WebSocket clients
+    REALTIME_UPDATE_INTERVAL = 1.0
+    
     def __init__(self, config: DashboardConfig = None):
         self.config = config or DashboardConfig()
-        self.app = FastAPI(title="Daydreamer Dashboard", version="1.0.0")
+        self.app = FastAPI(
+            title="Daydreamer Dashboard",
+            version="1.0.0",
+            default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+        )
         self.simulation: Optional[MultiAgentSimulation] = None
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.metrics_history: List[SimulationMetrics] = []
+        # Single producer that pushes updates to every connection
+        self._broadcast_task: Optional[asyncio.Task] = None
         
         # Setup routes
         self._setup_routes()
@@ -117,16 +145,40 @@ class WebDashboard:
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
             await websocket.accept()
-            self.active_connections.append(websocket)
+            self.active_connections.add(websocket)
+            
+            # Updates come from the shared broadcast loop, started on demand
+            if self._broadcast_task is None or self._broadcast_task.done():
+                self._broadcast_task = asyncio.create_task(self._broadcast_loop())
             
             try:
+                # Wait for the client to go away; incoming messages are ignored
                 while True:
-                    # Send periodic updates
-                    await asyncio.sleep(1)
-                    if websocket in self.active_connections:
-                        await websocket.send_text(json.dumps(self._get_realtime_data()))
+                    await websocket.receive_text()
             except WebSocketDisconnect:
-                self.active_connections.remove(websocket)
+                pass
+            finally:
+                self.active_connections.discard(websocket)
+    
+    async def _broadcast_loop(self):
+        """Push real-time data to all connected clients until none remain"""
+        while self.active_connections:
+            await asyncio.sleep(self.REALTIME_UPDATE_INTERVAL)
+            connections = list(self.active_connections)
+            if not connections:
+                break
+            
+            # Compute and encode once per tick, then send to everyone
+            payload = _dump_json(self._get_realtime_data())
+            results = await asyncio.gather(
+                *(websocket.send_bytes(payload) for websocket in connections),
+                return_exceptions=True
+            )
+            
+            # Drop connections that can no longer be written to
+            for websocket, result in zip(connections, results):
+                if isinstance(result, Exception):
+                    self.active_connections.discard(websocket)
     
     def _get_dashboard_html(self) -> str:
         """Generate the main dashboard HTML"""
@@ -435,8 +487,10 @@ class WebDashboard:
         function connectWebSocket() {
             ws = new WebSocket(`ws://${window.location.host}/ws`);
             
-            ws.onmessage = function(event) {
-                const data = JSON.parse(event.data);
+            ws.onmessage = async function(event) {
+                // Updates arrive as binary frames holding UTF-8 JSON
+                const text = typeof event.data === 'string' ? event.data : await event.data.text();
+                const data = JSON.parse(text);
                 updateDashboard(data);
             };
             
@@ -570,7 +624,7 @@ class WebDashboard:
                 "total_reasoning_sessions": 0,
                 "agent_interactions": 0,
                 "active_agents": [],
-                "last_activity": datetime.now().isoformat()
+                "last_activity": datetime.now()
             }
         
         stats = self.simulation.get_simulation_stats()
@@ -583,7 +637,7 @@ class WebDashboard:
             "total_reasoning_sessions": stats.get("total_reasoning_sessions", 0),
             "agent_interactions": stats.get("agent_interactions", 0),
             "active_agents": list(self.simulation.agents.keys()),
-            "last_activity": datetime.now().isoformat()
+            "last_activity": datetime.now()
         }
     
     async def _start_simulation(self, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the Daydreamer CLI configuration manager and log viewer.
+"""
+
+import random
+
+import pytest
+
+from src.ui.cli_interface import CLIInterface, ConfigurationManager, LogViewer, _load_json
+
+
+@pytest.fixture
+def cli(tmp_path, monkeypatch):
+    """CLIInterface whose config file lives in a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    interface = CLIInterface()
+    interface.config_manager.config_file = tmp_path / "daydreamer_cli_config.json"
+    return interface
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("42", 42),
+    ("2.5", 2.5),
+    ("true", True),
+    ("False", False),
+    ("[1, 'a']", [1, "a"]),
+    ("{'k': 1}", {"k": 1}),
+    ("hello", "hello"),
+    ("None", "None"),
+    ("1j", "1j"),
+    ("{1, 2}", "{1, 2}"),
+    ("{1: 2}", "{1: 2}"),
+    ("{[]: 1}", "{[]: 1}"),
+    ("1e999", "1e999"),
+    ("[1e999]", "[1e999]"),
+])
+def test_config_set_keeps_values_json_can_store(cli, raw, expected):
+    """config KEY VALUE stores a literal only if it survives a save and reload"""
+    cli._cmd_config(["key", raw])
+    value = cli.config_manager.get("key")
+    assert value == expected and type(value) is type(expected)
+
+    assert cli.config_manager.flush()
+    assert _load_json(cli.config_manager.config_file.read_bytes())["key"] == expected
+
+
+def test_log_viewer_matches_reference_list():
+    """get_logs, filtered or not, returns the newest buffered entries in order"""
+    viewer = LogViewer(ConfigurationManager())
+    size = viewer.max_buffer_size
+    levels = ["DEBUG", "INFO", "INFO", "WARNING", "ERROR"]
+    rng = random.Random(7)
+    reference = []
+
+    def check():
+        kept = reference[-size:]
+        for lines in (0, 1, 10, size, 2 * size):
+            for level in [None, "CRITICAL"] + levels:
+                expected = [f"{lvl}: {msg}" for lvl, msg in kept if level in (None, lvl)]
+                if lines > 0:
+                    expected = expected[-lines:]
+                logs = viewer.get_logs(lines, level)
+                assert [entry.split("] ", 1)[1] for entry in logs] == expected
+
+    # Fill below, well past and just past max_buffer_size, clearing in between
+    for rounds in (size // 2, 2 * size + 37, size + 1):
+        for i in range(rounds):
+            level, message = rng.choice(levels), f"m{len(reference)}"
+            viewer.add_log(message, level)
+            reference.append((level, message))
+            if i % 97 == 0:
+                check()
+        check()
+        viewer.clear_logs()
+        reference.clear()
+        check()
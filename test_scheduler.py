@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Tests for the Daydreamer task scheduler, scheduling algorithms and resource manager.
+"""
+
+import asyncio
+import copy
+import pickle
+import random
+import threading
+import time
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from src.scheduler import resource_manager, scheduling_algorithm
+from src.scheduler import (
+    DeadlineAlgorithm, HybridAlgorithm, PriorityAlgorithm, Resource, ResourceManager, ResourceType,
+    RoundRobinAlgorithm, SyncScheduler, Task, TaskPriority, TaskScheduler, TaskState
+)
+
+
+async def _wait_for(predicate, timeout: float = 2.0):
+    """Poll until predicate() is true or the timeout expires"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "timed out waiting for condition"
+        await asyncio.sleep(0.01)
+
+
+def test_cancelled_running_task_keeps_dependents_blocked():
+    """A task cancelled while running must not release its dependents"""
+    async def run():
+        scheduler = TaskScheduler(max_concurrent_tasks=2)
+        scheduler.resource_manager.add_resource(
+            Resource("cpu-0", ResourceType.CPU, 1.0, resource_id="cpu-0")
+        )
+        a = Task("a", "", estimated_duration=0.2, resources_required={"cpu"})
+        b = Task("b", "", estimated_duration=0.01, dependencies=[a.task_id])
+        assert scheduler.submit_task(a)
+        assert scheduler.submit_task(b)
+
+        await scheduler.start()
+        try:
+            await _wait_for(lambda: a.state is TaskState.RUNNING)
+            assert scheduler.cancel_task(a.task_id)
+            # Let a's execution finish and be processed
+            await _wait_for(lambda: a.task_id not in scheduler.running_tasks)
+            await asyncio.sleep(0.1)
+        finally:
+            await scheduler.stop()
+
+        assert a.state is TaskState.CANCELLED
+        assert b.state is TaskState.BLOCKED
+        stats = scheduler.get_stats()
+        assert stats["total_tasks_completed"] == 0
+        assert stats["total_tasks_cancelled"] == 1
+        assert scheduler.resource_manager.get_stats()["active_allocations"] == 0
+
+    asyncio.run(run())
+
+
+def test_resource_names_ignored_without_resource_management():
+    """Unknown resource names only matter when resources are managed"""
+    unmanaged = TaskScheduler(enable_resource_management=False)
+    assert unmanaged.submit_task(Task("t", "", resources_required={"llm"}))
+
+    managed = TaskScheduler()
+    assert not managed.submit_task(Task("t", "", resources_required={"llm"}))
+
+
+def _resource_manager(*capacities: float) -> ResourceManager:
+    """ResourceManager with one CPU resource per capacity, named r0, r1, ..."""
+    manager = ResourceManager()
+    for i, capacity in enumerate(capacities):
+        manager.add_resource(Resource(f"r{i}", ResourceType.CPU, capacity, resource_id=f"r{i}"))
+    return manager
+
+
+def test_deallocate_many_repeated_task_id():
+    """A repeated task id is released once, like a second deallocate_resources call"""
+    manager = _resource_manager(10.0)
+    assert manager.allocate_resources("t1", {"r0": 3.0})
+    assert manager.allocate_resources("t2", {"r0": 2.0})
+
+    assert manager.deallocate_many(["t1", "t1", "t2"]) == [True, False, True]
+    assert manager.allocations == {}
+    assert manager.resources["r0"].available == 10.0
+    assert manager.resources["r0"].allocated == 0.0
+
+
+def test_resource_copies_get_their_own_lock():
+    """Resources still copy and pickle, and copies share no lock or listeners"""
+    manager = _resource_manager(4.0)
+    resource = manager.resources["r0"]
+    assert manager.allocate_resources("t1", {"r0": 1.0})
+
+    for clone in (copy.copy(resource), copy.deepcopy(resource),
+                  pickle.loads(pickle.dumps(resource))):
+        assert clone.available == 3.0 and clone.allocated == 1.0
+        assert clone._lock is not resource._lock
+        assert clone._listeners == []
+    assert resource._listeners
+
+
+@pytest.mark.parametrize("algorithm_class", [PriorityAlgorithm, DeadlineAlgorithm, RoundRobinAlgorithm])
+def test_requeued_task_keeps_its_place(algorithm_class):
+    """A popped task that could not start goes back ahead of newer equal tasks"""
+    algorithm = algorithm_class()
+    first = Task("first", "")
+    second = Task("second", "")
+    algorithm.add_ready_task(first)
+    algorithm.add_ready_task(second)
+
+    for _ in range(3):
+        assert algorithm.pop_next_task() is first
+        algorithm.requeue_task(first)
+        algorithm.add_ready_task(Task("newer", ""))
+
+    assert algorithm.pop_next_task() is first
+    assert algorithm.pop_next_task() is second
+
+
+def test_requeue_preserves_priority_aging():
+    """Requeueing does not reset the enqueue tick that aging is measured from"""
+    algorithm = PriorityAlgorithm(aging_factor=1.0)
+    starved = Task("starved", "", priority=TaskPriority.LOW)
+    algorithm.add_ready_task(starved)
+    for i in range(3):
+        algorithm.add_ready_task(Task(f"urgent-{i}", "", priority=TaskPriority.URGENT))
+        assert algorithm.pop_next_task() is not starved
+
+    # starved has aged past a NORMAL task queued now, and must stay ahead of
+    # it after a failed start
+    algorithm.add_ready_task(Task("late", "", priority=TaskPriority.NORMAL))
+    assert algorithm.pop_next_task() is starved
+    algorithm.requeue_task(starved)
+    assert algorithm.pop_next_task() is starved
+
+
+@pytest.mark.parametrize("priorities, deadline_in, expected", [
+    ((TaskPriority.NORMAL, TaskPriority.NORMAL), None, "round_robin"),
+    ((TaskPriority.NORMAL, TaskPriority.HIGH), None, "round_robin"),
+    ((TaskPriority.LOW, TaskPriority.HIGH), None, "priority"),
+    ((TaskPriority.LOW, TaskPriority.HIGH), 600.0, "priority"),
+    ((TaskPriority.NORMAL, TaskPriority.NORMAL), 5.0, "deadline"),
+])
+def test_hybrid_routes_by_task_mix(priorities, deadline_in, expected):
+    """HybridAlgorithm hands each decision to the sub-algorithm fitting the mix"""
+    algorithm = HybridAlgorithm(urgent_window=60.0)
+    tasks = [Task(f"t{i}", "", priority=priority) for i, priority in enumerate(priorities)]
+    if deadline_in is not None:
+        tasks[0].set_deadline(datetime.fromtimestamp(time.time() + deadline_in))
+
+    assert algorithm.select_next_task(tasks) in tasks
+    assert algorithm.current_phase == expected
+    assert algorithm.get_stats()["current_phase"] == expected
+
+
+def _kernel_paths():
+    """allocate_many kernel paths available here: compiled and/or pure Python"""
+    paths = ["python"]
+    if resource_manager.NUMBA_AVAILABLE:
+        paths.append("numba")
+    return paths
+
+
+@pytest.mark.parametrize("path", _kernel_paths())
+def test_allocate_many_matches_sequential_allocation(path, monkeypatch):
+    """allocate_many admits exactly what sequential allocate_resources calls would"""
+    if path == "python":
+        monkeypatch.setattr(resource_manager, "NUMBA_AVAILABLE", False)
+        monkeypatch.setattr(resource_manager, "_fit_batch",
+                            getattr(resource_manager._fit_batch, "py_func",
+                                    resource_manager._fit_batch))
+
+    rng = random.Random(1234)
+    capacities = (5.0, 3.0, 8.0, 1.0)
+    resource_ids = [f"r{i}" for i in range(len(capacities))] + ["missing"]
+    requests = []
+    for i in range(60):
+        chosen = rng.sample(resource_ids, rng.randint(1, 3))
+        requests.append((f"t{i}", {rid: float(rng.randint(1, 3)) for rid in chosen}))
+
+    batched = _resource_manager(*capacities)
+    sequential = _resource_manager(*capacities)
+    results = batched.allocate_many(requests)
+    expected = [sequential.allocate_resources(task_id, needs) for task_id, needs in requests]
+
+    assert results == expected
+    assert any(expected) and not all(expected)
+    assert batched.allocations == sequential.allocations
+    for rid in resource_ids[:-1]:
+        assert batched.resources[rid].available == sequential.resources[rid].available
+        assert batched.resources[rid].allocated == sequential.resources[rid].allocated
+
+
+def test_allocate_many_partial_admission():
+    """A request that doesn't fit is skipped without blocking later ones"""
+    manager = _resource_manager(4.0, 2.0)
+    results = manager.allocate_many([
+        ("a", {"r0": 3.0}),
+        ("b", {"r0": 2.0, "r1": 1.0}),   # r0 no longer fits: nothing allocated
+        ("c", {"r1": 2.0}),
+        ("d", {"unknown": 1.0}),
+        ("e", {"r0": 1.0}),
+    ])
+
+    assert results == [True, False, True, False, True]
+    assert manager.allocations == {"a": {"r0": 3.0}, "c": {"r1": 2.0}, "e": {"r0": 1.0}}
+    assert manager.resources["r0"].available == 0.0
+    assert manager.resources["r1"].available == 0.0
+
+
+def test_sync_scheduler_pops_every_task_once():
+    """Tasks added from several producer threads are each popped exactly once"""
+    scheduler = SyncScheduler(PriorityAlgorithm())
+    producers, per_producer = 4, 250
+    done = threading.Event()
+    popped = []
+
+    def produce(n):
+        for i in range(per_producer):
+            scheduler.add_ready_task(Task(f"p{n}-{i}", "", priority=TaskPriority(i % 5 + 1)))
+
+    def consume():
+        while not (done.is_set() and scheduler.ready_count() == 0):
+            popped.extend(scheduler.pop_next_tasks(8))
+            scheduler.process_ready_tasks()
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    threads = [threading.Thread(target=produce, args=(n,)) for n in range(producers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    done.set()
+    consumer.join(timeout=10)
+
+    assert not consumer.is_alive()
+    names = [task.name for task in popped]
+    assert len(names) == producers * per_producer
+    assert len(set(names)) == len(names)
+
+
+def test_sync_scheduler_removes_pending_task():
+    """remove_ready_task finds a task that is still waiting in the add queue"""
+    scheduler = SyncScheduler(PriorityAlgorithm())
+    kept = Task("kept", "")
+    removed = Task("removed", "")
+    scheduler.add_ready_task(kept)
+    scheduler.add_ready_task(removed)
+
+    assert scheduler.remove_ready_task(removed)
+    assert not scheduler.remove_ready_task(removed)
+    assert scheduler.ready_count() == 1
+    assert scheduler.pop_next_task() is kept
+    assert scheduler.pop_next_task() is None
+
+
+# DeadlineAlgorithm.pop_next_task paths: (NUMBA_AVAILABLE, NUMPY_AVAILABLE)
+_DEADLINE_PATHS = {
+    "numba": (True, True),
+    "numpy": (False, True),
+    "scalar": (False, False),
+}
+
+
+def _deadline_pop_order(path: str, now_ts: float) -> List[str]:
+    """Pop order of a fixed workload with DeadlineAlgorithm forced onto one path"""
+    rng = random.Random(42)
+    threshold = scheduling_algorithm.VECTORIZE_THRESHOLD
+
+    def make_task(i):
+        offset = rng.choice([None, None, -5.0, 10.0, 30.0, 30.0, 120.0])
+        deadline = datetime.fromtimestamp(now_ts + offset) if offset is not None else None
+        return Task(f"t{i}", "", priority=TaskPriority(rng.randint(1, 5)), deadline=deadline)
+
+    initial = [make_task(i) for i in range(3 * threshold)]
+    later = [make_task(len(initial) + i) for i in range(threshold // 2)]
+
+    numba_available, numpy_available = _DEADLINE_PATHS[path]
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(scheduling_algorithm, "NUMBA_AVAILABLE", numba_available)
+        patch.setattr(scheduling_algorithm, "NUMPY_AVAILABLE", numpy_available)
+        patch.setattr(scheduling_algorithm.time, "time", lambda: now_ts)
+
+        algorithm = DeadlineAlgorithm()
+        for task in initial:
+            algorithm.add_ready_task(task)
+        # Removals swap rows around, so row order stops matching arrival order
+        for task in initial[::7]:
+            assert algorithm.remove_ready_task(task)
+
+        order = []
+        while True:
+            task = algorithm.pop_next_task()
+            if task is None:
+                break
+            order.append(task.name)
+            if len(order) % 5 == 0 and later:
+                algorithm.add_ready_task(later.pop(0))
+    return order
+
+
+@pytest.mark.parametrize("path", ["numba", "numpy"])
+def test_deadline_paths_pop_in_same_order(path):
+    """The compiled and vectorized paths select exactly like the scalar one"""
+    if path == "numba" and not scheduling_algorithm.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    if not scheduling_algorithm.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+
+    now_ts = time.time()
+    expected = _deadline_pop_order("scalar", now_ts)
+    # The workload starts well above the vectorization threshold and drains below it
+    assert len(expected) > 2 * scheduling_algorithm.VECTORIZE_THRESHOLD
+    assert _deadline_pop_order(path, now_ts) == expected
+
+
+@pytest.mark.parametrize("size", [3, 2 * scheduling_algorithm.VECTORIZE_THRESHOLD])
+def test_deadline_change_after_queueing(size):
+    """A deadline set after queueing is honoured below and above the threshold"""
+    algorithm = DeadlineAlgorithm()
+    tasks = [Task(f"t{i}", "") for i in range(size)]
+    for task in tasks:
+        algorithm.add_ready_task(task)
+    # Pop once so any column-based path has already scored the old values
+    assert algorithm.pop_next_task() is tasks[0]
+
+    tasks[-1].set_deadline(datetime.fromtimestamp(time.time() + 1.0))
+    assert algorithm.pop_next_task() is tasks[-1]